@@ -1,9 +1,19 @@
-from .powervle.interface import (PowerVLE, DefaultCallingConvention)
+from .powervle.interface import (PowerVLE, PowerVLEInstances, DefaultCallingConvention)
+from .powervle.commands import register_commands
+from .powervle.settings import register_settings
+from .powervle.warmup import start_warm_up
 from binaryninja.architecture import Architecture
 
+register_settings()
 PowerVLE.register()
 # TODO PowerVLE.extend("SP", ...).register()
 
 arch = Architecture[PowerVLE.name]
 arch.register_calling_convention(DefaultCallingConvention(arch, 'default'))
-arch.standalone_platform.default_calling_convention = arch.calling_conventions['default']
\ No newline at end of file
+arch.standalone_platform.default_calling_convention = arch.calling_conventions['default']
+
+register_commands()
+
+# decode tables and lifter modules are filled in off the startup path
+if PowerVLEInstances[PowerVLE.name].settings["powervle.warmup.enabled"]:
+    start_warm_up(PowerVLEInstances[PowerVLE.name])
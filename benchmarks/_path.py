@@ -0,0 +1,8 @@
+import os
+import sys
+
+
+# repo root, so stubs and powervle import when a benchmark runs as python benchmarks/<name>.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
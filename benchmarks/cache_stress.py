@@ -0,0 +1,96 @@
+try:
+    from . import _path
+except ImportError:
+    import _path
+
+import stubs
+stubs.install()
+
+import random
+import threading
+import time
+
+from powervle.decoder import Decoder
+from powervle.cache import DecodeCache
+from powervle.interface import PowerVLE
+
+
+class LockedCache:
+    # single global lock baseline to compare DecodeCache against
+
+    def __init__(self, decoder: Decoder):
+        self.decoder = decoder
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, data: bytes, addr: int = 0):
+        key = (data[:4], addr)
+        with self.lock:
+            if key in self.cache:
+                return self.cache[key]
+            inst = self.cache[key] = self.decoder.decode(data, addr)
+            return inst
+
+
+def workload(image: bytes, base: int, count: int, seed: int) -> list[tuple[bytes, int]]:
+    # analysis revisits the same addresses (info, text, llil, reanalysis), mostly close to each other
+    rng = random.Random(seed)
+    requests = []
+    offset = 0
+    while len(requests) < count:
+        if rng.random() < 0.05:
+            offset = rng.randrange(0, len(image) - 4) & ~1
+        for _ in range(3):
+            requests.append((image[offset:offset + 4], base + offset))
+        offset = (offset + 2 * rng.randint(1, 2)) % (len(image) - 4)
+    return requests
+
+
+def run(decode, threads: int, requests: list[list[tuple[bytes, int]]]) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(reqs):
+        barrier.wait()
+        for data, addr in reqs:
+            decode(data, addr)
+
+    pool = [threading.Thread(target=worker, args=(requests[i], )) for i in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=100000, help="requests per thread")
+    parser.add_argument("--image-size", type=int, default=0x40000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    image = bytes(rng.getrandbits(8) for _ in range(args.image_size))
+
+    for threads in args.threads:
+        requests = [workload(image, 0x1000, args.requests, args.seed + i) for i in range(threads)]
+        total = threads * args.requests
+
+        candidates = {
+            "uncached": Decoder(PowerVLE.categories),
+            "global-lock": LockedCache(Decoder(PowerVLE.categories)),
+            "sharded": DecodeCache(Decoder(PowerVLE.categories)),
+        }
+        for name, decode in candidates.items():
+            elapsed = run(decode, threads, requests)
+            line = f"threads={threads:<3} {name:<12} {total / elapsed:12.0f} req/s"
+            if isinstance(decode, DecodeCache):
+                stats = decode.stats
+                front = total - stats["back_hits"] - stats["misses"]
+                line += f"  front={front} back={stats['back_hits']} " \
+                        f"miss={stats['misses']} contended={stats['contended']}"
+            print(line)
@@ -0,0 +1,97 @@
+try:
+    from . import _path
+except ImportError:
+    import _path
+
+import stubs
+stubs.install()
+
+import random
+
+from binaryninja.lowlevelil import LowLevelILFunction
+
+from powervle.corpus import encodings, generate_image, load_histogram
+from powervle.interface import PowerVLE
+from powervle.lowlevelil import Options, RETURNS
+from powervle.scanner import sweep
+
+
+# lift option sets to compare, the first one is the reference
+CONFIGS = {
+    "expand": {},
+    "multiple=intrinsic": {"multiple": "intrinsic"},
+    "bswap=intrinsic": {"bswap": "intrinsic"},
+    "all intrinsic": {"multiple": "intrinsic", "bswap": "intrinsic"},
+}
+
+
+def synthetic_functions(arch: PowerVLE, count: int, body: int, histogram: dict = None, seed: int = 0) -> bytes:
+    # e_stmw prologue, random body, e_lmw epilogue and se_blr, like compiled leaf-saving functions
+    rng = random.Random(seed)
+    decoder = arch.decode.decoder
+    encs = encodings(decoder)
+    filler = generate_image(decoder, count * body * 4, histogram, seed)
+    bodies = [filler[offset:offset + inst_cls._length] for offset, inst_cls in sweep(decoder, filler) if inst_cls]
+    image = bytearray()
+    for i in range(count):
+        image += rng.choice(encs["e_stmw"]).bytes(rng)
+        image += b"".join(bodies[i * body:(i + 1) * body])
+        image += rng.choice(encs["e_lmw"]).bytes(rng)
+        image += rng.choice(encs["se_blr"]).bytes(rng)
+    return bytes(image)
+
+
+def functions(arch: PowerVLE, image: bytes) -> list[list[tuple[bytes, int]]]:
+    # straight-line runs ending in a return, which is what a prologue/epilogue pair brackets
+    result = [[]]
+    for offset, inst_cls in sweep(arch.decode.decoder, image):
+        if inst_cls:
+            result[-1].append((image[offset:offset + arch.max_instr_length], offset))
+            if inst_cls._name in RETURNS:
+                result.append([])
+    return [f for f in result if f]
+
+
+def expression_counts(arch: PowerVLE, funcs: list[list[tuple[bytes, int]]]) -> tuple[list[int], int]:
+    # a lifter that raises only loses its own expressions, the failures are reported next to the counts
+    counts, failed = [], 0
+    for func in funcs:
+        il = LowLevelILFunction(arch)
+        for data, addr in func:
+            try:
+                arch.get_instruction_low_level_il(data, addr, il)
+            except Exception:
+                failed += 1
+        counts.append(len(il.exprs))
+    return counts, failed
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="LLIL expression count per function under each lift option set")
+    parser.add_argument("--image", help="split this image at returns instead of generating functions")
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--body", type=int, default=24, help="instructions between prologue and epilogue")
+    parser.add_argument("--histogram", help="weights the body mnemonics, see corpus_generator.py")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    arch = PowerVLE()
+    if args.image:
+        with open(args.image, "rb") as f:
+            image = f.read()
+    else:
+        histogram = load_histogram(args.histogram) if args.histogram else None
+        image = synthetic_functions(arch, args.functions, args.body, histogram, args.seed)
+    funcs = functions(arch, image)
+
+    reference = None
+    defaults = Options.to_dict()
+    for name, options in CONFIGS.items():
+        Options.update(**{**defaults, **options})
+        counts, failed = expression_counts(arch, funcs)
+        total = sum(counts)
+        reference = reference or total
+        print(f"{name:<24} {total:>9} expressions  {total / len(counts):>8.1f} per function  "
+              f"{100 * (1 - total / reference):>5.1f}% fewer  {failed} failed lifts")
+    Options.update(**defaults)
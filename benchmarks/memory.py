@@ -0,0 +1,201 @@
+try:
+    from . import _path
+except ImportError:
+    import _path
+
+import stubs
+stubs.install()
+
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from powervle.cache import DecodeCache
+from powervle.corpus import generate_image
+from powervle.decoder import Decoder, path_mask
+from powervle.interface import PowerVLE
+from powervle.scanner import sweep
+from powervle.tables import DecodeTables
+
+
+# every structure is measured in a fresh process: once under tracemalloc for python heap bytes,
+# once without it for resident set size, which tracemalloc's own bookkeeping would inflate.
+#   steady: still allocated while the structure is alive
+#   peak:   highest point while it was built
+
+
+def rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    # kilobytes on linux, bytes on macos
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def setup(image_size: int, seed: int) -> dict:
+    decoder = Decoder(PowerVLE.categories, PowerVLE.mode)
+    decoder.map
+    return {"decoder": decoder, "image": generate_image(decoder, image_size, seed=seed)}
+
+
+def build_map(context: dict):
+    return Decoder(PowerVLE.categories, PowerVLE.mode).map
+
+
+def build_tables(context: dict):
+    return DecodeTables.compile(context["decoder"])
+
+
+def build_shared_tables(context: dict):
+    # what every attaching process maps instead of building its own tables
+    return DecodeTables.compile(context["decoder"]).to_bytes()
+
+
+def build_attached_tables(context: dict):
+    # a worker attaching to tables another process published
+    return DecodeTables.attach(context["published"].name, PowerVLE.categories, PowerVLE.mode)[0]
+
+
+def build_profile(context: dict):
+    decoder = context["decoder"]
+    decoder.start_profile()
+    for offset, inst_cls in sweep(decoder, context["image"]):
+        pass
+    layout = decoder.layout(decoder.stop_profile())
+    return {primary: [(*path_mask(path), inst_cls) for _, path, inst_cls in entries] for primary, entries in layout.items()}
+
+
+def build_sweep(context: dict):
+    return sweep(context["decoder"], context["image"])
+
+
+def build_decoded(context: dict):
+    decoder, image = context["decoder"], context["image"]
+    return [decoder.decode(image[offset:offset + 4], offset) for offset, inst_cls in sweep(decoder, image) if inst_cls]
+
+
+def fill_cache(context: dict) -> DecodeCache:
+    # default layer sizes, so the numbers are the ones a loaded plugin pays
+    decoder, image = context["decoder"], context["image"]
+    cache = DecodeCache(decoder)
+    for offset in range(0, len(image) - 2, 2):
+        cache.decode(image[offset:offset + 4], offset)
+    return cache
+
+
+def build_cache(context: dict):
+    return fill_cache(context)
+
+
+def build_cache_front(context: dict):
+    # one thread's front layer and the instructions only it still holds
+    cache = fill_cache(context)
+    for shard, _ in cache.shards:
+        shard.clear()
+    return cache
+
+
+def build_cache_back(context: dict):
+    cache = fill_cache(context)
+    cache.local.front.clear()
+    return cache
+
+
+STRUCTURES = {
+    "decoder/map": build_map,
+    "decoder/tables": build_tables,
+    "decoder/shared-tables": build_shared_tables,
+    "decoder/attached-tables": build_attached_tables,
+    "decoder/profile": build_profile,
+    "sweep/image": build_sweep,
+    "decode/image": build_decoded,
+    "cache/full": build_cache,
+    "cache/front": build_cache_front,
+    "cache/back": build_cache_back,
+}
+
+
+def measure(name: str, image_size: int, seed: int, traced: bool) -> dict[str, int]:
+    context = setup(image_size, seed)
+    structure = None
+    if name == "decoder/attached-tables":
+        context["published"] = DecodeTables.compile(context["decoder"]).publish()
+    try:
+        if traced:
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            structure = STRUCTURES[name](context)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return {"heap_steady": current - before, "heap_peak": peak - before}
+
+        before = rss()
+        structure = STRUCTURES[name](context)
+        # ru_maxrss covers the whole process, setup included, so it only bounds the build peak
+        return {"rss_steady": rss() - before, "rss_peak": max(peak_rss() - before, 0)}
+    finally:
+        if "published" in context:
+            if structure is not None:
+                structure.release()
+            context["published"].close()
+            context["published"].unlink()
+
+
+def run(names: list[str], image_size: int, seed: int) -> dict[str, dict[str, int]]:
+    results = {}
+    # cache shards are picked by hash, a fixed seed makes their fill level repeatable
+    os.environ["PYTHONHASHSEED"] = "0"
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context, max_tasks_per_child=1) as pool:
+        for name in names:
+            results[name] = {}
+            for traced in (True, False):
+                results[name].update(pool.submit(measure, name, image_size, seed, traced).result())
+    return results
+
+
+def check_budgets(results: dict[str, dict[str, int]], budgets: dict[str, dict[str, int]]) -> list[str]:
+    # budgets: {structure: {metric: max bytes}}
+    over = []
+    for name, limits in budgets.items():
+        for metric, limit in limits.items():
+            if (value := results.get(name, {}).get(metric, None)) != None and value > limit:
+                over.append(f"{name} {metric} {value} > {limit}")
+    return over
+
+
+if __name__ == "__main__":
+    hexint = lambda x: int(x, 16)
+    from argparse import ArgumentParser
+    parser = ArgumentParser()
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES), choices=list(STRUCTURES))
+    parser.add_argument("--image-size", type=hexint, default=0x40000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results as json")
+    parser.add_argument("--budgets", help="json {structure: {metric: max bytes}}, exits non-zero when one is exceeded")
+    args = parser.parse_args()
+
+    results = run(args.structures, args.image_size, args.seed)
+    for name, metrics in results.items():
+        print(f"{name:<24} " + "  ".join(f"{metric}={value / 1024:>9.0f}K" for metric, value in metrics.items()))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"version": 1, "image_size": args.image_size, "results": results}, f, indent=2)
+
+    if args.budgets:
+        with open(args.budgets) as f:
+            over = check_budgets(results, json.load(f))
+        for line in over:
+            print(f"over budget: {line}")
+        sys.exit(1 if over else 0)
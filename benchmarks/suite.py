@@ -0,0 +1,180 @@
+try:
+    from . import _path
+except ImportError:
+    import _path
+
+import stubs
+stubs.install()
+
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from binaryninja.lowlevelil import LowLevelILFunction
+
+from powervle.corpus import class_words, generate_image
+from powervle.decoder import Decoder
+from powervle.interface import PowerVLE
+from powervle.lowlevelil import InstLiftTable
+from powervle.scanner import sweep
+
+
+# every result is ns per operation, lower is better.
+# a result regresses when it is slower than the baseline by more than its group's threshold
+THRESHOLDS = {
+    "decode": 0.10,
+    "sweep": 0.10,
+    "render": 0.10,
+    "lift": 0.15,
+    "import": 0.25,
+}
+
+
+def measure(fn, items: list, repeat: int) -> float:
+    # best of repeat passes over items, in ns per item. like timeit, without the garbage collector
+    best = None
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for item in items:
+                fn(item)
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best == None else min(best, elapsed)
+            gc.collect()
+    finally:
+        if enabled:
+            gc.enable()
+    return best / max(len(items), 1)
+
+
+def rounds(cases: dict[str, tuple], repeat: int) -> dict[str, float]:
+    # one pass over every case per round, so a burst of machine noise hits one round of many cases
+    # instead of every round of a few
+    results = {}
+    for _ in range(repeat):
+        for name, (fn, items) in cases.items():
+            ns = measure(fn, items, 1)
+            results[name] = min(results.get(name, ns), ns)
+    return results
+
+
+def bench_decode(decoder: Decoder, words: dict[type, list[int]], repeat: int) -> dict[str, float]:
+    forms = {}
+    for inst_cls, ws in words.items():
+        forms.setdefault(inst_cls._form, []).extend(w.to_bytes(4, "big") for w in ws)
+    return rounds({f"decode/{form}": (decoder.decode, data) for form, data in sorted(forms.items())}, repeat)
+
+
+def bench_sweep(decoder: Decoder, image: bytes, repeat: int) -> dict[str, float]:
+    # per halfword of the image
+    return {"sweep/image": measure(lambda data: sweep(decoder, data), [image], repeat) / (len(image) // 2)}
+
+
+def bench_render(arch: PowerVLE, image: bytes, repeat: int) -> dict[str, float]:
+    offsets = [(image[i:i + 4], i) for i in range(0, len(image) - 4, 2)]
+    # the decode cache is warm, as it is after get_instruction_info in a real analysis
+    for data, addr in offsets:
+        arch.decode(data, addr)
+    return {"render/text": measure(lambda item: arch.get_instruction_text(*item), offsets, repeat)}
+
+
+def bench_lift(arch: PowerVLE, words: dict[type, list[int]], repeat: int) -> dict[str, float]:
+    cases = {}
+    lift = lambda item: arch.get_instruction_low_level_il(item[0], item[1], LowLevelILFunction(arch))
+    for inst_cls, ws in sorted(words.items(), key=lambda item: item[0]._name):
+        if not InstLiftTable.get(inst_cls._name, None):
+            continue
+        items = [(w.to_bytes(4, "big"), 0x1000) for w in ws]
+        try:
+            lift(items[0])
+        except Exception as e:
+            print(f"lift/{inst_cls._name} failed: {e!r}", file=sys.stderr)
+            continue
+        cases[f"lift/{inst_cls._name}"] = (lift, items)
+
+    results = rounds(cases, repeat)
+    results["lift/mean"] = sum(results.values()) / len(results) if results else 0.0
+    return results
+
+
+def bench_import(repeat: int) -> dict[str, float]:
+    # fresh interpreter per run, so nothing is imported yet
+    code = "import stubs; stubs.install(); import time; t = time.perf_counter_ns(); " \
+           "import powervle.interface; print(time.perf_counter_ns() - t)"
+    # from the repo root, stubs and powervle aren't importable from the caller's directory
+    best = min(int(subprocess.check_output([sys.executable, "-c", code], cwd=_path.ROOT).decode()) for _ in range(repeat))
+    return {"import/interface": float(best)}
+
+
+def run(image: bytes = None, seed: int = 0, repeat: int = 5, per_class: int = 64, image_size: int = 0x10000) -> dict[str, float]:
+    rng = random.Random(seed)
+    arch = PowerVLE()
+    decoder = Decoder(PowerVLE.categories, PowerVLE.mode)
+    words = class_words(decoder, rng, per_class)
+    if image == None:
+        image = generate_image(decoder, image_size, seed=seed)
+
+    results = {}
+    results.update(bench_decode(decoder, words, repeat))
+    results.update(bench_sweep(decoder, image, repeat))
+    results.update(bench_render(arch, image, repeat))
+    results.update(bench_lift(arch, words, repeat))
+    results.update(bench_import(repeat))
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], scale: float = 1.0) -> list[dict]:
+    rows = []
+    for name, ns in sorted(results.items()):
+        if name not in baseline or not baseline[name]:
+            continue
+        ratio = ns / baseline[name]
+        threshold = THRESHOLDS[name.split("/")[0]] * scale
+        rows.append({"name": name, "baseline": baseline[name], "current": ns,
+                     "ratio": ratio, "regression": ratio > 1 + threshold})
+    return rows
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser()
+    parser.add_argument("--image", help="benchmark sweep and render on this image instead of a synthetic one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--per-class", type=int, default=64, help="words per instruction class")
+    parser.add_argument("--save", help="write the results as json")
+    parser.add_argument("--baseline", help="compare against results saved with --save, e.g. benchmarks/baseline.json")
+    parser.add_argument("--threshold-scale", type=float, default=1.0, help="scale every regression threshold")
+    args = parser.parse_args()
+
+    image = None
+    if args.image:
+        with open(args.image, "rb") as f:
+            image = f.read()
+
+    results = run(image, args.seed, args.repeat, args.per_class)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"version": 1, "python": platform.python_version(), "results": results}, f, indent=2)
+
+    if not args.baseline:
+        for name, ns in sorted(results.items()):
+            print(f"{name:<32} {ns:>12.0f} ns")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    rows = compare(results, baseline, args.threshold_scale)
+    for row in rows:
+        mark = "REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<32} {row['baseline']:>12.0f} {row['current']:>12.0f} ns  x{row['ratio']:.2f}  {mark}")
+    regressions = [row for row in rows if row["regression"]]
+    print(f"{len(rows)} compared, {len(regressions)} regressions")
+    sys.exit(1 if regressions else 0)
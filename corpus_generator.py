@@ -0,0 +1,35 @@
+import stubs
+stubs.install()
+
+import random
+
+from powervle.corpus import class_words, generate_image, load_histogram
+from powervle.decoder import Decoder
+from powervle.interface import PowerVLE, PowerVLEVariants
+
+
+if __name__ == "__main__":
+    hexint = lambda x: int(x, 16)
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="synthetic valid encodings and firmware-like images")
+    parser.add_argument("out", help="image file, or - to list encodings per class")
+    parser.add_argument("--size", type=hexint, default=0x100000)
+    parser.add_argument("--histogram", help="instruction_counter.py output or json {name: count} to weight mnemonics")
+    parser.add_argument("--per-class", type=int, default=4, help="encodings per class when listing")
+    parser.add_argument("--variant", default=PowerVLE.name, choices=list(PowerVLEVariants))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    decoder = Decoder(*PowerVLEVariants[args.variant])
+
+    if args.out == "-":
+        words = class_words(decoder, random.Random(args.seed), args.per_class)
+        for inst_cls, ws in sorted(words.items(), key=lambda item: item[0]._name):
+            for w in ws:
+                print(f"{w >> 16:04x}      {inst_cls._name}" if inst_cls._length == 2 else f"{w:08x}  {inst_cls._name}")
+    else:
+        histogram = load_histogram(args.histogram) if args.histogram else None
+        image = generate_image(decoder, args.size, histogram, args.seed)
+        with open(args.out, "wb") as f:
+            f.write(image)
+        print(f"{len(image):#x} bytes written to {args.out}")
@@ -0,0 +1,35 @@
+import stubs
+stubs.install()
+
+import sys
+import time
+
+from powervle.interface import PowerVLEVariants
+from powervle.snapshot import generate, check, dump, load
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="golden decode snapshot of every category set")
+    parser.add_argument("command", choices=["generate", "check"])
+    parser.add_argument("--snapshot", default="snapshots/decode.snap.xz")
+    parser.add_argument("--per-leaf", type=int, default=8, help="random samples per decode tree leaf")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=20, help="differences to print")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == "generate":
+        snapshot = generate(PowerVLEVariants, args.per_leaf, args.seed)
+        dump(args.snapshot, snapshot)
+        for name, records in snapshot.items():
+            print(f"{name:<20} {records if type(records) == str else f'{len(records)} words'}")
+        print(f"written to {args.snapshot} in {time.perf_counter() - start:.1f}s")
+        sys.exit(0)
+
+    diffs = check(load(args.snapshot), PowerVLEVariants)
+    for name, word, expected, actual in diffs[:args.limit]:
+        where = f"{word:08x}" if word != None else "decoder"
+        print(f"{name} {where}\n  expected: {expected}\n  actual:   {actual}")
+    print(f"{len(diffs)} differences in {time.perf_counter() - start:.1f}s")
+    sys.exit(1 if diffs else 0)
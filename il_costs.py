@@ -0,0 +1,56 @@
+import stubs
+stubs.install()
+
+import json
+
+from binaryninja.lowlevelil import LowLevelILFunction
+
+from powervle.interface import PowerVLE, PowerVLEVariants, variant_arch
+from powervle.lowlevelil import Options
+from powervle.scanner import sweep
+from powervle.trace import LLIL, read_trace, replay
+
+
+def lift_image(arch: PowerVLE, data: bytes):
+    il = LowLevelILFunction(arch)
+    for offset, inst_cls in sweep(arch.decode.decoder, data):
+        if inst_cls:
+            arch.get_instruction_low_level_il(data[offset:offset + arch.max_instr_length], offset, il)
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="LLIL expressions, instructions and unimplemented fallbacks per mnemonic")
+    parser.add_argument("file", help="raw image, or a callback trace with --trace")
+    parser.add_argument("--trace", action="store_true", help="replay the lifter calls of a trace_replay.py trace")
+    parser.add_argument("--variant", default=PowerVLE.name, choices=list(PowerVLEVariants))
+    parser.add_argument("--options", default="", help="lift options, e.g. multiple=intrinsic,bswap=intrinsic")
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--json", help="write the full report as json")
+    args = parser.parse_args()
+
+    arch = variant_arch(args.variant)
+    if args.options:
+        Options.update(**dict(option.split("=", 1) for option in args.options.split(",")))
+
+    costs = arch.enable_il_costs()
+    if args.trace:
+        replay(arch, read_trace(args.file), (LLIL, ))
+    else:
+        with open(args.file, "rb") as f:
+            lift_image(arch, f.read())
+    arch.disable_il_costs()
+
+    report = costs.report()
+    total = sum(entry["expressions"] for entry in report.values()) or 1
+    print(f"{'mnemonic':<16} {'lifts':>9} {'exprs':>10} {'share':>6} {'per lift':>9} {'insts':>9} {'unimpl':>9}")
+    for name, entry in list(report.items())[:args.top]:
+        print(f"{name:<16} {entry['lifts']:>9} {entry['expressions']:>10} {100 * entry['expressions'] / total:>5.1f}% "
+              f"{entry['expressions_per_lift']:>9.1f} {entry['instructions']:>9} {entry['unimplemented']:>9}")
+    unimplemented = sorted(((entry["unimplemented"], name) for name, entry in report.items() if entry["unimplemented"]), reverse=True)
+    if unimplemented:
+        print("unimplemented: " + ", ".join(f"{name} {count}" for count, name in unimplemented[:args.top]))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"file": args.file, "options": Options.to_dict(), "mnemonics": report}, f, indent=2)
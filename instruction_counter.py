@@ -1,4 +1,8 @@
+import stubs
+stubs.install()
+
 from powervle.decoder import *
+from powervle.scanner import sweep
 
 
 if __name__ == "__main__":
@@ -9,6 +13,8 @@ if __name__ == "__main__":
     parser.add_argument("--start", type=hexint, default=-1)
     parser.add_argument("--length", type=hexint, default=-1)
     parser.add_argument("--print", action='store_true')
+    parser.add_argument("--profile", help="load a decode profile before counting")
+    parser.add_argument("--profile-out", help="write a decode profile of this run")
     args = parser.parse_args()
 
     with open(args.file, 'rb') as f:
@@ -23,36 +29,34 @@ if __name__ == "__main__":
         data += b'\x00' * (4 - len(data) % 4)
     
     decoder = Decoder(PowerCategory.V)
+    if args.profile:
+        decoder.load_profile(args.profile)
+    if args.profile_out:
+        decoder.start_profile()
     
     counter = {"unknown": 0}
     
-    from io import BytesIO
-    bio = BytesIO(data)
-    while (cur := bio.read(4)):
-
-        inst = decoder.decode(cur)
-        if not inst:
+    for offset, inst_cls in sweep(decoder, data, max(args.start, 0)):
+        if not inst_cls:
             counter["unknown"] += 1
             inst_name = "unknown"
-            inst_size = 4
-        else:
-            if inst.name not in counter:
-                counter[inst.name] = 0
-            counter[inst.name] += 1
-            inst_name = inst.name
-            inst_size = inst.length
-
-        if inst_size == 2:
-            bio.seek(-2, 1) if len(cur) > 2 else None
-            if args.print:
-                data = int.from_bytes(cur[:2], 'big')
-                print(f"{data:04x}      {inst_name}")
-        elif inst_size == 4:
-            if args.print:
-                data = int.from_bytes(cur, 'big')
-                print(f"{data:08x}  {inst_name}")
+            inst_size = 2
         else:
-            raise ValueError
+            if inst_cls._name not in counter:
+                counter[inst_cls._name] = 0
+            counter[inst_cls._name] += 1
+            inst_name = inst_cls._name
+            inst_size = inst_cls._length
+
+        if args.print:
+            word = int.from_bytes(data[offset:offset + inst_size], 'big')
+            if inst_size == 2:
+                print(f"{word:04x}      {inst_name}")
+            else:
+                print(f"{word:08x}  {inst_name}")
+
+    if args.profile_out:
+        decoder.dump_profile(args.profile_out, decoder.stop_profile())
 
     name_max_len = len(max(counter.keys(), key=len))
 
@@ -0,0 +1,100 @@
+import stubs
+stubs.install()
+
+import json
+import os
+
+from binaryninja.lowlevelil import LowLevelILFunction
+
+from powervle.instrumentation import CountingIL
+from powervle.interface import PowerVLE, PowerVLEVariants, variant_arch
+from powervle.lowlevelil import InstLiftTable, RETURNS
+from powervle.scanner import region_map, score_windows, sweep
+
+
+def image_files(paths: list[str]) -> list[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names))
+        else:
+            files.append(path)
+    return files
+
+
+def code_ranges(arch: PowerVLE, data: bytes, code_only: bool) -> list[tuple[int, int]]:
+    if not code_only:
+        return [(0, len(data))]
+    return [(region["start"], region["end"]) for region in region_map(score_windows(arch.decode.decoder, data)) if region["kind"] == "code"]
+
+
+def scan(arch: PowerVLE, data: bytes, coverage: dict, image: str, code_only: bool = False):
+    # function boundaries are approximated by returns, images carry no symbols
+    # coverage: mnemonic -> {"occurrences", "unlifted", "functions", "images"}, the last two of unlifted ones
+    function = 0
+    for start, end in code_ranges(arch, data, code_only):
+        function += 1
+        il = LowLevelILFunction(arch)
+        code = data[start:end]
+        for offset, inst_cls in sweep(arch.decode.decoder, code, start):
+            if not inst_cls:
+                continue
+            name = inst_cls._name
+            if (entry := coverage.get(name, None)) is None:
+                entry = coverage[name] = {"occurrences": 0, "unlifted": 0, "functions": set(), "images": set()}
+            entry["occurrences"] += 1
+            counting = CountingIL(il)
+            arch.get_instruction_low_level_il(code[offset:offset + arch.max_instr_length], start + offset, counting)
+            if counting.fallbacks:
+                entry["unlifted"] += 1
+                entry["functions"].add((image, function))
+                entry["images"].add(image)
+            if name in RETURNS:
+                function += 1
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="mnemonics which lift to il.unimplemented(), ranked by how often they occur")
+    parser.add_argument("paths", nargs="+", help="raw images or folders of them")
+    parser.add_argument("--variant", default=PowerVLE.name, choices=list(PowerVLEVariants))
+    parser.add_argument("--code-only", action="store_true", help="skip windows region_scanner.py classifies as data")
+    parser.add_argument("--sort", default="occurrences", choices=["occurrences", "functions"])
+    parser.add_argument("--top", type=int, default=40)
+    parser.add_argument("--json", help="write the full report as json")
+    args = parser.parse_args()
+
+    arch = variant_arch(args.variant)
+
+    coverage = {}
+    files = image_files(args.paths)
+    for file in files:
+        with open(file, "rb") as f:
+            scan(arch, f.read(), coverage, file, args.code_only)
+
+    report = []
+    for name, entry in coverage.items():
+        if not entry["unlifted"]:
+            continue
+        # missing: no InstLiftTable entry, fallback: its lifter has no branch for it, partial: not for every operand
+        if not InstLiftTable.get(name, None):
+            status = "missing"
+        elif entry["unlifted"] == entry["occurrences"]:
+            status = "fallback"
+        else:
+            status = "partial"
+        report.append({"mnemonic": name, "status": status, "occurrences": entry["unlifted"],
+                       "functions": len(entry["functions"]), "images": len(entry["images"])})
+    report.sort(key=lambda entry: (entry[args.sort], entry["occurrences"]), reverse=True)
+
+    print(f"{'mnemonic':<16} {'status':<9} {'occurrences':>11} {'functions':>9} {'images':>6}")
+    for entry in report[:args.top]:
+        print(f"{entry['mnemonic']:<16} {entry['status']:<9} {entry['occurrences']:>11} {entry['functions']:>9} {entry['images']:>6}")
+    total = sum(entry["occurrences"] for entry in coverage.values())
+    unlifted = sum(entry["occurrences"] for entry in report)
+    print(f"{len(report)} mnemonics, {unlifted} of {total} instructions unlifted in {len(files)} images")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"paths": args.paths, "variant": args.variant, "mnemonics": report}, f, indent=2)
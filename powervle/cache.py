@@ -0,0 +1,85 @@
+import threading
+
+from .decoder import Decoder
+from .instruction import Instruction
+
+
+MISSING = object()
+
+# approximate heap per cached instruction: key, instruction object and dict slot, from benchmarks/memory.py
+ENTRY_BYTES = 320
+
+
+class DecodeCache:
+    # per-thread front caches backed by a sharded store shared between analysis threads.
+    # cached instructions are never mutated, so readers don't need a lock; only inserts take the shard lock.
+
+    def __init__(self, decoder: Decoder, front_size: int = 1024, back_size: int = 1 << 15, shards: int = 16):
+        self.decoder = decoder
+        self.front_size = front_size
+        self.shard_size = max(1, back_size // shards)
+        self.shards = [({}, threading.Lock()) for _ in range(shards)]
+        self.local = threading.local()
+        self.thread_stats = []
+        self.stats_lock = threading.Lock()
+
+    def attach(self) -> dict:
+        # front hits are left uncounted to keep the hit path short
+        self.local.front = {}
+        self.local.stats = {"back_hits": 0, "misses": 0, "contended": 0}
+        with self.stats_lock:
+            self.thread_stats.append(self.local.stats)
+        return self.local.front
+
+    def decode(self, data: bytes, addr: int = 0) -> Instruction | None:
+        key = (data[:4], addr)
+        try:
+            front = self.local.front
+        except AttributeError:
+            front = self.attach()
+
+        # front_size 0 turns the front layer off, every lookup goes to the shared store
+        if self.front_size and (inst := front.get(key, MISSING)) is not MISSING:
+            return inst
+
+        stats = self.local.stats
+        shard, lock = self.shards[hash(key) % len(self.shards)]
+        if (inst := shard.get(key, MISSING)) is not MISSING:
+            stats["back_hits"] += 1
+        else:
+            stats["misses"] += 1
+            inst = self.decoder.decode(data, addr)
+            if not lock.acquire(blocking=False):
+                stats["contended"] += 1
+                lock.acquire()
+            try:
+                if len(shard) >= self.shard_size:
+                    shard.clear()
+                shard[key] = inst
+            finally:
+                lock.release()
+
+        if self.front_size:
+            if len(front) >= self.front_size:
+                front.clear()
+            front[key] = inst
+        return inst
+
+    __call__ = decode
+
+    def clear(self):
+        for shard, lock in self.shards:
+            with lock:
+                shard.clear()
+        # front caches of other threads are dropped on their next overflow
+        if hasattr(self.local, "front"):
+            self.local.front.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        total = {"threads": len(self.thread_stats), "entries": sum(len(shard) for shard, _ in self.shards)}
+        with self.stats_lock:
+            for stats in self.thread_stats:
+                for k, v in stats.items():
+                    total[k] = total.get(k, 0) + v
+        return total
@@ -0,0 +1,166 @@
+from binaryninja import PluginCommand
+from binaryninja.binaryview import BinaryView, BinaryViewType
+from binaryninja.function import Function
+from binaryninja.interaction import get_save_filename_input
+from binaryninja.log import log_info
+
+from .diagnostics import Warnings
+from .interface import PowerVLE, PowerVLEInstances, PowerVLEVariants, register_variant
+from .scanner import detect_variant
+
+
+def get_arch(bv: BinaryView) -> PowerVLE | None:
+    return PowerVLEInstances.get(bv.arch.name, None) if bv.arch else None
+
+
+def enable_instrumentation(bv: BinaryView):
+    get_arch(bv).enable_instrumentation()
+    log_info(f"{bv.arch.name}: callback instrumentation enabled")
+
+
+def disable_instrumentation(bv: BinaryView):
+    get_arch(bv).disable_instrumentation()
+    log_info(f"{bv.arch.name}: callback instrumentation disabled")
+
+
+def dump_instrumentation(bv: BinaryView):
+    file = get_save_filename_input("Callback statistics", "json", get_arch(bv).settings["powervle.instrumentation.statsPath"])
+    if file:
+        file = file.decode() if isinstance(file, bytes) else file
+        get_arch(bv).dump_instrumentation(file)
+        log_info(f"{bv.arch.name}: callback statistics written to {file}")
+
+
+def enable_il_costs(bv: BinaryView):
+    get_arch(bv).enable_il_costs()
+    log_info(f"{bv.arch.name}: IL cost accounting enabled")
+
+
+def disable_il_costs(bv: BinaryView):
+    get_arch(bv).disable_il_costs()
+    log_info(f"{bv.arch.name}: IL cost accounting disabled")
+
+
+def dump_il_costs(bv: BinaryView):
+    file = get_save_filename_input("IL costs", "json", get_arch(bv).settings["powervle.instrumentation.ilCostsPath"])
+    if file:
+        file = file.decode() if isinstance(file, bytes) else file
+        get_arch(bv).dump_il_costs(file)
+        log_info(f"{bv.arch.name}: IL costs written to {file}")
+
+
+def start_sampling(bv: BinaryView):
+    get_arch(bv).start_sampling()
+    log_info(f"{bv.arch.name}: sampling profiler started")
+
+
+def stop_sampling(bv: BinaryView):
+    get_arch(bv).stop_sampling()
+    log_info(f"{bv.arch.name}: sampling profiler stopped")
+
+
+def dump_sampling(bv: BinaryView):
+    file = get_save_filename_input("Collapsed stacks", "txt", get_arch(bv).settings["powervle.instrumentation.stacksPath"])
+    if file:
+        file = file.decode() if isinstance(file, bytes) else file
+        get_arch(bv).dump_sampling(file)
+        log_info(f"{bv.arch.name}: collapsed stacks written to {file}")
+
+
+def start_trace(bv: BinaryView):
+    file = get_save_filename_input("Callback trace", "pvtr", get_arch(bv).settings["powervle.instrumentation.tracePath"])
+    if file:
+        file = file.decode() if isinstance(file, bytes) else file
+        get_arch(bv).start_trace(file)
+        log_info(f"{bv.arch.name}: recording callbacks to {file}")
+
+
+def stop_trace(bv: BinaryView):
+    arch = get_arch(bv)
+    records = arch.recorder.records
+    arch.stop_trace()
+    log_info(f"{bv.arch.name}: callback trace stopped after {records} records")
+
+
+def resolve_function_jump_tables(bv: BinaryView, func: Function):
+    tables = get_arch(bv).jump_tables.apply(bv, func)
+    log_info(f"{func.name}: {tables} se_bctr jump tables resolved")
+
+
+def resolve_jump_tables(bv: BinaryView):
+    tables = 0
+    for func in bv.functions:
+        if func.arch and func.arch.name == bv.arch.name:
+            tables += get_arch(bv).jump_tables.apply(bv, func)
+    log_info(f"{bv.arch.name}: {tables} se_bctr jump tables resolved")
+
+
+def resolve_after_analysis(bv: BinaryView):
+    # new targets are analyzed as new blocks, which may end in further tables,
+    # so this runs again after every analysis pass that set something
+    if get_arch(bv) is None:
+        return
+    tables = 0
+    for func in bv.functions:
+        if func.arch and func.arch.name == bv.arch.name:
+            tables += get_arch(bv).jump_tables.apply(bv, func)
+    if tables:
+        log_info(f"{bv.arch.name}: {tables} se_bctr jump tables resolved after analysis")
+        bv.add_analysis_completion_event(lambda: resolve_after_analysis(bv))
+
+
+def detect_core_variant(bv: BinaryView):
+    ranking = detect_variant(PowerVLEVariants, bv.read(bv.start, bv.end - bv.start), bv.start)
+    for entry in ranking:
+        log_info(f"{entry['name']}: " + (f"unavailable, {entry['error']}" if "error" in entry else f"score {entry['score']:.3f}"))
+    best = ranking[0]["name"]
+    if best != bv.arch.name:
+        # registered for the next load of the file, the view keeps its architecture
+        register_variant(best)
+        log_info(f"{bv.arch.name}: {best} decodes this view better, reopen it with that architecture")
+
+
+def summarize_diagnostics(bv: BinaryView):
+    Warnings.summarize()
+
+
+def register_commands():
+    is_valid = lambda bv: get_arch(bv) is not None
+    has_stats = lambda bv: is_valid(bv) and get_arch(bv).stats is not None
+    has_costs = lambda bv: is_valid(bv) and get_arch(bv).costs is not None
+    has_samples = lambda bv: is_valid(bv) and get_arch(bv).sampler is not None
+    is_tracing = lambda bv: is_valid(bv) and get_arch(bv).recorder is not None
+
+    PluginCommand.register("POWER VLE\\Instrumentation\\Enable",
+                           "Record per-callback and per-mnemonic latencies", enable_instrumentation, is_valid)
+    PluginCommand.register("POWER VLE\\Instrumentation\\Disable",
+                           "Stop recording callback latencies", disable_instrumentation, has_stats)
+    PluginCommand.register("POWER VLE\\Instrumentation\\Dump statistics...",
+                           "Write callback latency statistics as json", dump_instrumentation, has_stats)
+    PluginCommand.register("POWER VLE\\Instrumentation\\Enable IL costs",
+                           "Count the LLIL expressions each mnemonic's lifter emits", enable_il_costs, is_valid)
+    PluginCommand.register("POWER VLE\\Instrumentation\\Disable IL costs",
+                           "Stop counting emitted LLIL", disable_il_costs, has_costs)
+    PluginCommand.register("POWER VLE\\Instrumentation\\Dump IL costs...",
+                           "Write per-mnemonic LLIL costs as json", dump_il_costs, has_costs)
+    PluginCommand.register("POWER VLE\\Profiler\\Start sampling",
+                           "Sample plugin stacks while callbacks run", start_sampling, is_valid)
+    PluginCommand.register("POWER VLE\\Profiler\\Stop sampling",
+                           "Stop the sampling profiler", stop_sampling, has_samples)
+    PluginCommand.register("POWER VLE\\Profiler\\Dump collapsed stacks...",
+                           "Write sampled stacks for flamegraphs", dump_sampling, has_samples)
+    PluginCommand.register("POWER VLE\\Trace\\Start recording...",
+                           "Record callback traffic for offline replay", start_trace, is_valid)
+    PluginCommand.register("POWER VLE\\Trace\\Stop recording",
+                           "Stop recording callback traffic", stop_trace, is_tracing)
+    PluginCommand.register_for_function("POWER VLE\\Jump tables\\Resolve in function",
+                                        "Set se_bctr switch tables of this function as indirect branch targets",
+                                        resolve_function_jump_tables, lambda bv, func: is_valid(bv))
+    PluginCommand.register("POWER VLE\\Jump tables\\Resolve in all functions",
+                           "Set se_bctr switch tables of every function as indirect branch targets", resolve_jump_tables, is_valid)
+    PluginCommand.register("POWER VLE\\Detect core variant",
+                           "Score the candidate category sets on this view and register the best one", detect_core_variant, is_valid)
+    PluginCommand.register("POWER VLE\\Diagnostics\\Log suppressed warnings",
+                           "Log the repeated warnings held back since the last summary", summarize_diagnostics, is_valid)
+
+    BinaryViewType.add_binaryview_initial_analysis_completion_event(resolve_after_analysis)
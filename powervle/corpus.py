@@ -0,0 +1,86 @@
+import json
+import random
+
+from .decoder import Decoder, path_mask
+from .instruction import Instruction
+
+
+class Encoding:
+    # opcode bits fixed by the decode path, operand fields random, reserved bits zero
+
+    def __init__(self, inst_cls: type[Instruction], path: tuple):
+        self.inst_cls = inst_cls
+        self.mask, self.value = path_mask(path)
+        self.fields = 0
+        for field in inst_cls._fields.values():
+            # split fields are tuples of (start, end, shift) pieces
+            for start, end, *_ in field if type(field[0]) == tuple else (field, ):
+                self.fields |= ((1 << (end - start)) - 1) << (32 - end)
+        self.fields &= ~self.mask
+
+    def word(self, rng: random.Random) -> int:
+        return self.value | (rng.getrandbits(32) & self.fields)
+
+    def bytes(self, rng: random.Random) -> bytes:
+        return self.word(rng).to_bytes(4, "big")[:self.inst_cls._length]
+
+
+def encodings(decoder: Decoder) -> dict[str, list[Encoding]]:
+    # a class can sit on more than one leaf, e.g. when an extended opcode bit is don't care
+    result = {}
+    for path, inst_cls in decoder.map.leaves():
+        result.setdefault(inst_cls._name, []).append(Encoding(inst_cls, path))
+    return result
+
+
+def class_words(decoder: Decoder, rng: random.Random, count: int) -> dict[type[Instruction], list[int]]:
+    # count words per class which decode back to that class
+    words = {}
+    for name, encs in encodings(decoder).items():
+        found = []
+        for i in range(count * 4):
+            enc = encs[i % len(encs)]
+            word = enc.word(rng)
+            if decoder.lookup(word) is enc.inst_cls:
+                found.append(word)
+                if len(found) == count:
+                    break
+        if found:
+            words[encs[0].inst_cls] = found
+    return words
+
+
+def load_histogram(file: str) -> dict[str, int]:
+    # json {name: count} or the "name : count" listing printed by instruction_counter.py
+    with open(file) as f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        return {name: int(count) for name, count in json.loads(text).items()}
+    histogram = {}
+    for line in text.splitlines():
+        name, sep, count = line.rpartition(":")
+        if sep and count.strip().isdigit():
+            histogram[name.strip()] = int(count)
+    return histogram
+
+
+def generate_image(decoder: Decoder, size: int, histogram: dict[str, int] = None, seed: int = 0) -> bytes:
+    # instructions drawn by histogram weight (uniform without one), names the decoder lacks are dropped.
+    # never splits an instruction, so the image may end up to 3 bytes short of size
+    rng = random.Random(seed)
+    encs = encodings(decoder)
+    names = [name for name in (histogram or encs) if name in encs and (not histogram or histogram[name] > 0)]
+    if not names:
+        raise ValueError("no histogram entry names an instruction of this decoder")
+    weights = [histogram[name] for name in names] if histogram else None
+
+    image = bytearray()
+    while len(image) + 4 <= size:
+        for name in rng.choices(names, weights, k=1024):
+            enc = rng.choice(encs[name])
+            data = enc.bytes(rng)
+            if len(image) + 4 > size:
+                break
+            if decoder.lookup(int.from_bytes(data.ljust(4, b"\0"), "big")) is enc.inst_cls:
+                image += data
+    return bytes(image)
@@ -0,0 +1,71 @@
+from struct import unpack_from
+
+from .decoder import Decoder
+from .instruction import Instruction
+from .utils import get_bits_from_int
+
+
+class DecodeCursor:
+    # walks a buffer (bytes, memoryview, mmap, ...) in place without building Instruction objects
+
+    def __init__(self, decoder: Decoder, buffer, offset: int = 0, addr: int = 0):
+        self.decoder = decoder
+        self.buffer = buffer
+        self.size = len(buffer)
+        self.base = addr - offset
+        self.offset = offset
+        self.word = 0
+        self.inst_cls = None
+        self.load()
+
+    def load(self):
+        remain = self.size - self.offset
+        if remain >= 4:
+            self.word = unpack_from(">I", self.buffer, self.offset)[0]
+        elif remain >= 2:
+            self.word = unpack_from(">H", self.buffer, self.offset)[0] << 16
+        else:
+            self.word = 0
+            self.inst_cls = None
+            return
+        inst_cls = self.decoder.lookup(self.word)
+        self.inst_cls = inst_cls if inst_cls and inst_cls._length <= remain else None
+
+    def seek(self, offset: int):
+        self.offset = offset
+        self.load()
+
+    def advance(self, step: int = 0) -> bool:
+        self.offset += step or self.length or 2
+        self.load()
+        return self.offset < self.size
+
+    def __iter__(self):
+        while self.offset + 2 <= self.size:
+            yield self
+            self.advance()
+
+    @property
+    def addr(self) -> int:
+        return self.base + self.offset
+
+    @property
+    def valid(self) -> bool:
+        return self.inst_cls is not None
+
+    @property
+    def length(self) -> int:
+        return self.inst_cls._length if self.inst_cls else 0
+
+    @property
+    def name(self) -> str | None:
+        return self.inst_cls._name if self.inst_cls else None
+
+    def get_field_value(self, name: str) -> int | None:
+        if self.inst_cls and (field := self.inst_cls._fields.get(name, None)) != None:
+            length = self.inst_cls._length * 8
+            return get_bits_from_int(self.word >> (32 - length), length, *field)
+
+    def instruction(self) -> Instruction | None:
+        if self.inst_cls:
+            return self.inst_cls(self.word, self.addr, self.decoder.x64)
@@ -1,5 +1,7 @@
 from typing_extensions import Self
 from enum import Flag, auto
+from collections import Counter
+import json
 
 from .instruction import (
     Instruction,
@@ -67,6 +69,45 @@ class Map:
             else:
                 return child
 
+    def decode_counted(self, data: int, counter: Counter, path: tuple = ()) -> type[Instruction] | None:
+        counter[path] += 1
+        key = get_bits_from_int(data, 32, self.start, self.end)
+        if key in self.childs:
+            child = self.childs[key]
+            path += ((self.start, self.end, key), )
+            if isinstance(child, Map):
+                return child.decode_counted(data, counter, path)
+            else:
+                counter[path] += 1
+                return child
+
+    def resolve(self, path: tuple) -> Self | type[Instruction] | None:
+        node = self
+        for start, end, key in path:
+            if not isinstance(node, Map) or (node.start, node.end) != (start, end):
+                return None
+            node = node.childs.get(key, None)
+        return node
+
+    def leaves(self, path: tuple = ()):
+        # yields (path, instruction class) for every leaf below this node
+        for key, child in self.childs.items():
+            child_path = path + ((self.start, self.end, key), )
+            if isinstance(child, Map):
+                yield from child.leaves(child_path)
+            else:
+                yield child_path, child
+
+
+def path_mask(path: tuple) -> tuple[int, int]:
+    mask, value = 0, 0
+    for start, end, key in path:
+        shift = 32 - end
+        mask |= ((1 << (end - start)) - 1) << shift
+        value |= key << shift
+    return mask, value
+
+
 class Lv:
     start: int
     end: int
@@ -1087,25 +1128,19 @@ class Decoder:
                 })
             }),
             0x7: Level(0, 6, {  # entire opcode level (inst[0:6])
-                0b011111: Level(21, 24, { # First XO 3-bits inst[21:24]
-                    0x0: Level(24, 31, { # Second and last XO 4-bits inst[24:31]
-                        0b0000111: InstX("lvebx", "VEC", ["VRT", "RA", "RB"]),  
-                        0b0100111: InstX("lvehx", "VEC", ["VRT", "RA", "RB"]),
-                        0b1000111: InstX("lvewx", "VEC", ["VRT", "RA", "RB"]),
-                        0b1100111: InstX("lvx", "VEC", ["VRT", "RA", "RB"]),
-                    }),
-                    0x1: Level(24, 31, {
-                        0b0100111: InstX("stvehx", "VEC", ["VRS", "RA", "RB"]),
-                        0b1000111: InstX("stvewx", "VEC", ["VRS", "RA", "RB"]),
-                        0b0011111: InstX("stvx", "VEC", ["VRS", "RA", "RB"]),
-                    }),
-                    0x2: Level(24, 31, {
-                        0b1100111: InstX("lvxl", "VEC", ["VRT", "RA", "RB"]),
-                        0b0000111: InstX("stvebx", "VEC", ["VRS", "RA", "RB"]),
+                0b011111: Level(27, 31, { # split like the other categories' opcode 31 levels, so the maps merge
+                    0x7: Level(21, 27, {
+                        0b000000: InstX("lvebx", "VEC", ["VRT", "RA", "RB"]),
+                        0b000010: InstX("lvehx", "VEC", ["VRT", "RA", "RB"]),
+                        0b000100: InstX("lvewx", "VEC", ["VRT", "RA", "RB"]),
+                        0b000110: InstX("lvx", "VEC", ["VRT", "RA", "RB"]),
+                        0b001000: InstX("stvebx", "VEC", ["VRS", "RA", "RB"]),
+                        0b001010: InstX("stvehx", "VEC", ["VRS", "RA", "RB"]),
+                        0b001100: InstX("stvewx", "VEC", ["VRS", "RA", "RB"]),
+                        0b001110: InstX("stvx", "VEC", ["VRS", "RA", "RB"]),
+                        0b010110: InstX("lvxl", "VEC", ["VRT", "RA", "RB"]),
+                        0b011110: InstX("stvxl", "VEC", ["VRS", "RA", "RB"]),
                     }),
-                    0x3: Level(24, 31, {
-                        0b1100111: InstX("stvxl", "VEC", ["VRS", "RA", "RB"]),
-                    })
                 })
             }),
         }),
@@ -1283,34 +1318,128 @@ class Decoder:
 
     }
 
-    def __init__(self, categories: PowerCategory = None, mode: str = "SPEenable"):
+    def __init__(self, categories: PowerCategory = None, mode: str = "SPEenable", tables=None):
         self.mode = mode.upper()
-        base_map = Decoder.VLE_INST_TABLE.map()
+        if self.mode not in ("SPEENABLE", "SPEDISABLE"):
+            raise ValueError("Unknown mode. Supported modes: SPEenable, SPEdisable.")
         if categories is None:
             categories = []
+        self.categories = categories
         self.x64 = PowerCategory.X64 in categories if categories else False
-        if self.mode == "SPEENABLE":
-            for cat in categories:
-                if cat in (PowerCategory.V): # TODO: PowerCategory.LMA
-                    continue
-                if cat in self.VLE_INST_EXTRA:
-                    base_map = self.VLE_INST_EXTRA[cat].map(base_map)
-            self.map = base_map
-        elif self.mode == "SPEDISABLE":
-            for cat in categories:
-                if cat == PowerCategory.SP:
-                    continue
-                if cat in self.VLE_INST_EXTRA:
-                    base_map = self.VLE_INST_EXTRA[cat].map(base_map)
-            self.map = base_map
+        self._map = None
+        self.counter = None
+        self.fast = {}
+        self.tables = tables
+        self.reset_lookup()
+
+    @classmethod
+    def levels(cls, categories: PowerCategory, mode: str) -> list[type[Lv]]:
+        levels = [cls.VLE_INST_TABLE]
+        for cat in categories:
+            if mode == "SPEENABLE" and cat in (PowerCategory.V): # TODO: PowerCategory.LMA
+                continue
+            if mode == "SPEDISABLE" and cat == PowerCategory.SP:
+                continue
+            if cat in cls.VLE_INST_EXTRA:
+                levels.append(cls.VLE_INST_EXTRA[cat])
+        return levels
+
+    @property
+    def map(self) -> Map:
+        # built on first use, so decoders attached to prebuilt tables skip the merge
+        if self._map is None:
+            base_map = None
+            for level in self.levels(self.categories, self.mode):
+                base_map = level.map(base_map)
+            self._map = base_map
+        return self._map
+
+    def reset_lookup(self):
+        # the tables beat a profile fast path in front of them, so the fast path only speeds up the tree
+        if self.counter is not None:
+            self.lookup = self.lookup_counted
+        elif self.tables:
+            self.lookup = self.tables.lookup
+        elif self.fast:
+            self.lookup = self.lookup_fast
         else:
-            raise ValueError("Unknown mode. Supported modes: SPEenable, SPEdisable.")
+            self.lookup = self.map.decode
+
+    def use_tables(self, tables):
+        self.tables = tables
+        self.reset_lookup()
 
     def __call__(self, data: bytes, addr: int = 0) -> Instruction | None:
         return self.decode(data, addr)
 
     def decode(self, data: bytes, addr: int = 0) -> Instruction | None:
         target = int.from_bytes(data[:4] if len(data) >= 4 else data + b'\0\0', 'big')
-        inst_cls = self.map.decode(target)
+        inst_cls = self.lookup(target)
         if inst_cls and len(data) >= inst_cls._length:
-            return inst_cls(target, addr, self.x64)
\ No newline at end of file
+            return inst_cls(target, addr, self.x64)
+
+    def lookup_counted(self, data: int) -> type[Instruction] | None:
+        return self.map.decode_counted(data, self.counter)
+
+    def lookup_fast(self, data: int) -> type[Instruction] | None:
+        for mask, value, inst_cls in self.fast.get(data >> (32 - self.map.end), ()):
+            if data & mask == value:
+                return inst_cls
+        return self.map.decode(data)
+
+    def start_profile(self):
+        self.counter = Counter()
+        self.reset_lookup()
+
+    def stop_profile(self) -> Counter:
+        counter, self.counter = self.counter, None
+        self.reset_lookup()
+        return counter
+
+    def layout(self, counter: Counter, limit: int = 8, min_share: float = 0.01) -> dict[int, list[tuple]]:
+        # hot leaves grouped by primary opcode, most visited first
+        leaves = {}
+        for path, hits in counter.items():
+            if path and not isinstance(inst_cls := self.map.resolve(path), Map) and inst_cls:
+                leaves.setdefault(path[0][2], []).append((hits, path, inst_cls))
+
+        layout = {}
+        for primary, entries in leaves.items():
+            total = sum(hits for hits, _, _ in entries)
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+            layout[primary] = [entry for entry in entries[:limit] if entry[0] >= total * min_share]
+        return layout
+
+    def dump_profile(self, file: str, counter: Counter, limit: int = 8, min_share: float = 0.01):
+        nodes = [
+            {"path": [list(level) for level in path], "hits": hits}
+            for path, hits in counter.most_common() if isinstance(self.map.resolve(path), Map)
+        ]
+        fast = {
+            str(primary): [
+                {"name": inst_cls._name, "path": [list(level) for level in path], "hits": hits}
+                for hits, path, inst_cls in entries
+            ]
+            for primary, entries in sorted(self.layout(counter, limit, min_share).items())
+        }
+        with open(file, "w") as f:
+            json.dump({"version": 1, "total": counter[()], "fast": fast, "nodes": nodes}, f)
+
+    def load_profile(self, file: str):
+        with open(file) as f:
+            profile = json.load(f)
+        if profile.get("version") != 1:
+            raise ValueError(f"unsupported decode profile version: {profile.get('version')}")
+
+        fast = {}
+        for primary, entries in profile["fast"].items():
+            for entry in entries:
+                path = tuple(tuple(level) for level in entry["path"])
+                inst_cls = self.map.resolve(path)
+                # skip leaves which don't exist in this decoder's category set
+                if isinstance(inst_cls, Map) or not inst_cls or inst_cls._name != entry["name"]:
+                    continue
+                fast.setdefault(int(primary), []).append((*path_mask(path), inst_cls))
+
+        self.fast = fast
+        self.reset_lookup()
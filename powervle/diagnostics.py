@@ -0,0 +1,54 @@
+import threading
+from collections import Counter
+from time import monotonic
+
+from binaryninja.log import log_warn
+
+
+class Diagnostics:
+    # de-duplicates messages by format string and arguments: the first `first` of each are logged,
+    # later ones are only counted and summarized at most every `interval` seconds.
+    # nothing is formatted for suppressed messages. counts may be off by a few when threads race,
+    # which is not worth a lock on the render and lift paths
+
+    def __init__(self, log=log_warn, first: int = 1, interval: float = 30.0, top: int = 10):
+        self.log = log
+        self.first = first
+        self.interval = interval
+        self.top = top
+        self.counts = {}
+        self.pending = Counter()
+        self.next_summary = monotonic() + interval
+        self.lock = threading.Lock()
+
+    def warn(self, message: str, *args):
+        key = (message, *args)
+        count = self.counts[key] = self.counts.get(key, 0) + 1
+        if count <= self.first:
+            self.log(message.format(*args) + (" (further occurrences are summarized)" if count == self.first else ""))
+            return
+        self.pending[key] += 1
+        if monotonic() >= self.next_summary:
+            self.summarize()
+
+    def summarize(self):
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            pending, self.pending = self.pending, Counter()
+            self.next_summary = monotonic() + self.interval
+            if not pending:
+                return
+            lines = [f"{count}x {message.format(*args)}" for (message, *args), count in pending.most_common(self.top)]
+            if len(pending) > self.top:
+                lines.append(f"... and {len(pending) - self.top} more")
+            self.log(f"{sum(pending.values())} repeated diagnostics suppressed:\n  " + "\n  ".join(lines))
+        finally:
+            self.lock.release()
+
+    def report(self) -> dict[str, int]:
+        return {message.format(*args): count for (message, *args), count in
+                sorted(self.counts.items(), key=lambda item: item[1], reverse=True)}
+
+
+Warnings = Diagnostics()
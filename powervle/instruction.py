@@ -1,5 +1,4 @@
 from .utils import *
-from binaryninja.log import log_warn, log_error, log_debug
 
 def scimm(f: int, scl: int, ui8: int) -> int:
     scale = scl * 8
@@ -248,6 +247,7 @@ def Inst(
     length: int,
     fields: dict,
     operands: list[str | bytes | int],
+    form: str = None,
     **other
 ) -> type[Instruction]:
 
@@ -257,6 +257,7 @@ def Inst(
         "_length": length,
         "_fields": fields,
         "_operands": operands,
+        "_form": form,
         **other
     })
 
@@ -269,7 +270,7 @@ def InstBD8(name: str, category: str, operands: list[str | bytes | int], **other
         "XO": (6, 7),
         "LK": (7, 8),
         "BD8": (8, 16),
-    }, operands, **other)
+    }, operands, "BD8", **other)
 
 
 def InstBD15(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -279,7 +280,7 @@ def InstBD15(name: str, category: str, operands: list[str | bytes | int], **othe
         "BI32": (12, 16),
         "BD15": (16, 31),
         "LK": (31, 32),
-    }, operands, **other)
+    }, operands, "BD15", **other)
 
 
 def InstBD24(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -287,14 +288,14 @@ def InstBD24(name: str, category: str, operands: list[str | bytes | int], **othe
         "OPCD": (0, 6),
         "BD24": (7, 31),
         "LK": (31, 32),
-    }, operands, **other)
+    }, operands, "BD24", **other)
 
 
 def InstC(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 2, {
         "OPCD": (0, 16),
         "LK": (15, 16),
-    }, operands, **other)
+    }, operands, "C", **other)
 
 
 def InstIM5(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -303,7 +304,7 @@ def InstIM5(name: str, category: str, operands: list[str | bytes | int], **other
         "XO": (6, 7),
         "UI5": (7, 12),
         "RX": (12, 16),
-    }, operands, **other)
+    }, operands, "IM5", **other)
 
 
 def InstOIM5(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -313,7 +314,7 @@ def InstOIM5(name: str, category: str, operands: list[str | bytes | int], **othe
         "Rc": (6, 7),
         "OIM5": (7, 12),
         "RX": (12, 16),
-    }, operands, **other)
+    }, operands, "OIM5", **other)
 
 
 def InstIM7(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -321,7 +322,7 @@ def InstIM7(name: str, category: str, operands: list[str | bytes | int], **other
         "OPCD": (0, 5),
         "UI7": (5, 12),
         "RX": (12, 16),
-    }, operands, **other)
+    }, operands, "IM7", **other)
 
 
 def InstR(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -329,7 +330,7 @@ def InstR(name: str, category: str, operands: list[str | bytes | int], **other)
         "OPCD": (0, 6),
         "XO": (6, 12),
         "RX": (12, 16),
-    }, operands, **other)
+    }, operands, "R", **other)
 
 
 def InstRR(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -341,7 +342,7 @@ def InstRR(name: str, category: str, operands: list[str | bytes | int], **other)
         "ARY": (8, 12),
         "RX": (12, 16),
         "ARX": (12, 16),
-    }, operands, **other)
+    }, operands, "RR", **other)
 
 
 def InstSD4(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -350,7 +351,7 @@ def InstSD4(name: str, category: str, operands: list[str | bytes | int], **other
         "SD4": (4, 8),
         "RZ": (8, 12),
         "RX": (12, 16),
-    }, operands, **other)
+    }, operands, "SD4", **other)
 
 
 def InstD(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -367,7 +368,7 @@ def InstD(name: str, category: str, operands: list[str | bytes | int], **other)
         "D": (16, 32),
         "SI": (16, 32),
         "UI": (16, 32),
-    }, operands, **other)
+    }, operands, "D", **other)
 
 
 def InstD8(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -378,7 +379,7 @@ def InstD8(name: str, category: str, operands: list[str | bytes | int], **other)
         "RA": (11, 16),
         "XO": (16, 24),
         "D8": (24, 32),
-    }, operands, **other)
+    }, operands, "D8", **other)
 
 
 def InstI16A(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -388,7 +389,7 @@ def InstI16A(name: str, category: str, operands: list[str | bytes | int], **othe
         "XO": (16, 21),
         "SI": ((6, 11, 11), (21, 32, 0)),
         "UI": ((6, 11, 11), (21, 32, 0)),
-    }, operands, **other)
+    }, operands, "I16A", **other)
 
 
 def InstI16L(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -397,7 +398,7 @@ def InstI16L(name: str, category: str, operands: list[str | bytes | int], **othe
         "RT": (6, 11),
         "XO": (16, 21),
         "UI": ((11, 16, 11), (21, 32, 0))
-    }, operands, **other)
+    }, operands, "I16L", **other)
 
 
 def InstM(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -411,7 +412,7 @@ def InstM(name: str, category: str, operands: list[str | bytes | int], **other)
         "ME": (26, 31),
         "Rc": (31, 32),
         "XO": (31, 32)
-    }, operands, **other)
+    }, operands, "M", **other)
 
 
 def InstSCI8(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -428,7 +429,7 @@ def InstSCI8(name: str, category: str, operands: list[str | bytes | int], **othe
         "F": (21, 22),
         "SCL": (22, 24),
         "UI8": (24, 32),
-    }, operands, **other)
+    }, operands, "SCI8", **other)
 
 
 def InstLI20(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -437,7 +438,7 @@ def InstLI20(name: str, category: str, operands: list[str | bytes | int], **othe
         "RT": (6, 11),
         "XO": (16, 17),
         "li20": ((17, 21, 16), (11, 16, 11), (21, 32, 0))
-    }, operands, **other)
+    }, operands, "LI20", **other)
 
 def InstX(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -466,7 +467,7 @@ def InstX(name: str, category: str, operands: list[str | bytes | int], **other)
         "TO" : (6, 11),
         "FRT" : (6, 11),
         "MO" : (6, 11) # For E Category - mbar instruction
-    }, operands, **other)
+    }, operands, "X", **other)
 
 def InstVX(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -477,7 +478,7 @@ def InstVX(name: str, category: str, operands: list[str | bytes | int], **other)
         "XO" : (21, 31),
         "UIM" : (11, 16),
         "SIM" : (11, 16)
-    }, operands, **other)
+    }, operands, "VX", **other)
 
 def InstVA(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -488,7 +489,7 @@ def InstVA(name: str, category: str, operands: list[str | bytes | int], **other)
         "VRC" : (21, 26),
         "XO" : (26, 31),
         "SHB" : (22, 26)
-    }, operands, **other)
+    }, operands, "VA", **other)
 
 # EVX-Form
 def InstEVX(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -503,7 +504,7 @@ def InstEVX(name: str, category: str, operands: list[str | bytes | int], **other
         "RB": (16, 21),
         "UI_16_21": (16, 21),
         "XO": (21, 32),
-    }, operands, **other)
+    }, operands, "EVX", **other)
 
 # EVS-Form
 def InstEVS(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
@@ -514,7 +515,7 @@ def InstEVS(name: str, category: str, operands: list[str | bytes | int], **other
         "RB": (16, 21),
         "XO": (21, 29),
         "BFA": (29, 32),
-    }, operands, **other)
+    }, operands, "EVS", **other)
 
 def InstXL(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -529,7 +530,7 @@ def InstXL(name: str, category: str, operands: list[str | bytes | int], **other)
         "LK" : (31, 32),
         "BF" : (6, 9),
         "BFA" : (11, 14)
-    }, operands, **other)
+    }, operands, "XL", **other)
 
 def InstXO(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -540,7 +541,7 @@ def InstXO(name: str, category: str, operands: list[str | bytes | int], **other)
         "OE": (21, 22),
         "XO": (22, 31),
         "Rc": (31, 32)
-    }, operands, **other)
+    }, operands, "XO", **other)
 
 def InstXFX(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -555,7 +556,7 @@ def InstXFX(name: str, category: str, operands: list[str | bytes | int], **other
         "FXM": (12, 20),
         "XO": (21, 31),
         "PMRN": (11, 21) # For E.PM Category - mfpmr, mtpmr
-    }, operands, **other)
+    }, operands, "XFX", **other)
 
 def InstA(name: str, category: str, operands: list[str | bytes | int], **other) -> type[Instruction]:
     return Inst(name, category, 4, {
@@ -570,4 +571,4 @@ def InstA(name: str, category: str, operands: list[str | bytes | int], **other)
         "BC": (21, 26),
         "XO": (26, 31),
         "Rc": (31, 32)
-    }, operands, **other)
\ No newline at end of file
+    }, operands, "A", **other)
\ No newline at end of file
@@ -0,0 +1,281 @@
+import json
+import os
+import sys
+import threading
+from collections import Counter
+from time import perf_counter_ns
+
+from .trace import TraceRecorder, TRACED_CALLBACKS
+
+
+INSTRUMENTED_CALLBACKS = (
+    "get_instruction_info",
+    "get_instruction_text",
+    "get_instruction_low_level_il",
+    "get_flag_write_low_level_il",
+)
+
+
+class ThreadStats:
+    # per-thread entry dicts, merged on report, so recording needs no lock.
+    # subclasses fill entries() in record() and sum thread_entries() in merged()
+
+    def __init__(self):
+        self.local = threading.local()
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def entries(self) -> dict:
+        try:
+            return self.local.entries
+        except AttributeError:
+            self.local.entries = {}
+            with self.lock:
+                self.threads.append(self.local.entries)
+            return self.local.entries
+
+    def thread_entries(self) -> list[dict]:
+        with self.lock:
+            return list(self.threads)
+
+    def dump(self, file: str):
+        with open(file, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class CallbackStats(ThreadStats):
+    # an entry is [count, total ns, max ns, log2(ns) histogram buckets]
+
+    def record(self, callback: str, key: str, elapsed: int):
+        entries = self.entries()
+        for k in (callback, (callback, key)):
+            if (entry := entries.get(k, None)) is None:
+                entry = entries[k] = [0, 0, 0, [0] * 64]
+            entry[0] += 1
+            entry[1] += elapsed
+            if elapsed > entry[2]:
+                entry[2] = elapsed
+            entry[3][min(elapsed.bit_length(), 63)] += 1
+
+    def merged(self) -> dict:
+        merged = {}
+        for entries in self.thread_entries():
+            for k, (count, total, peak, buckets) in list(entries.items()):
+                if (entry := merged.get(k, None)) is None:
+                    entry = merged[k] = [0, 0, 0, [0] * 64]
+                entry[0] += count
+                entry[1] += total
+                entry[2] = max(entry[2], peak)
+                entry[3] = [a + b for a, b in zip(entry[3], buckets)]
+        return merged
+
+    def report(self) -> dict:
+        def describe(entry):
+            count, total, peak, buckets = entry
+            return {
+                "count": count,
+                "total_ns": total,
+                "mean_ns": total // count if count else 0,
+                "max_ns": peak,
+                # bucket i counts calls which took [2 ** (i - 1), 2 ** i) ns
+                "histogram": {str(1 << i): n for i, n in enumerate(buckets) if n},
+            }
+
+        report = {"callbacks": {}, "mnemonics": {}}
+        for k, entry in sorted(self.merged().items(), key=lambda item: str(item[0])):
+            if isinstance(k, tuple):
+                callback, key = k
+                report["mnemonics"].setdefault(callback, {})[key] = describe(entry)
+            else:
+                report["callbacks"][k] = describe(entry)
+        return report
+
+
+class CountingIL:
+    # forwards to the real LowLevelILFunction, counting what a lifter builds and appends.
+    # the counters must not shadow a LowLevelILFunction attribute
+
+    NOT_EXPRESSIONS = ("get_label_for_address", "mark_label", "add_label_for_address", "set_current_address")
+
+    def __init__(self, il):
+        self.il = il
+        self.expressions = 0
+        self.appended = 0
+        self.fallbacks = 0
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.il, name)
+        if not callable(attr) or name in self.NOT_EXPRESSIONS:
+            return attr
+
+        def build(*args, **kwargs):
+            self.expressions += 1
+            if name == "unimplemented":
+                self.fallbacks += 1
+            return attr(*args, **kwargs)
+        return build
+
+    def append(self, expr):
+        self.appended += 1
+        return self.il.append(expr)
+
+
+class ILCosts(ThreadStats):
+    # [lifts, expressions, instructions, unimplemented] per mnemonic
+
+    def record(self, key: str, il: CountingIL):
+        entries = self.entries()
+        if (entry := entries.get(key, None)) is None:
+            entry = entries[key] = [0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += il.expressions
+        entry[2] += il.appended
+        entry[3] += il.fallbacks
+
+    def merged(self) -> dict:
+        merged = {}
+        for entries in self.thread_entries():
+            for key, counts in list(entries.items()):
+                merged[key] = [a + b for a, b in zip(merged.get(key, [0, 0, 0, 0]), counts)]
+        return merged
+
+    def report(self) -> dict:
+        # ranked by total expressions, i.e. frequency times cost per lift
+        report = {}
+        for key, (lifts, expressions, instructions, unimplemented) in sorted(
+                self.merged().items(), key=lambda item: item[1][1], reverse=True):
+            report[key] = {
+                "lifts": lifts,
+                "expressions": expressions,
+                "instructions": instructions,
+                "unimplemented": unimplemented,
+                "expressions_per_lift": expressions / lifts,
+            }
+        return report
+
+
+class SamplingProfiler:
+    # samples the stacks of threads which are inside a plugin callback, other threads are never looked at
+
+    PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+    DECODER_MODULES = ("decoder", "instruction", "cursor", "cache", "tables", "utils")
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.active = {}
+        self.stacks = Counter()
+        self.samples = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None
+
+    def enter(self):
+        ident = threading.get_ident()
+        self.active[ident] = self.active.get(ident, 0) + 1
+
+    def exit(self):
+        ident = threading.get_ident()
+        if (depth := self.active.get(ident, 1) - 1):
+            self.active[ident] = depth
+        else:
+            self.active.pop(ident, None)
+
+    def start(self):
+        if self.thread is None:
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name="power-vle-sampler", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            frames = sys._current_frames()
+            for ident in list(self.active):
+                if (frame := frames.get(ident, None)) is not None and (stack := self.collapse(frame)):
+                    self.stacks[stack] += 1
+                    self.samples += 1
+
+    def collapse(self, frame) -> str | None:
+        # only frames of this package, outermost first, prefixed by the decoder/lifter/plugin group.
+        # the group is the outermost lifter or decoder frame's, so instruction helpers a lifter calls count as lifter time
+        names = []
+        group = None
+        while frame is not None:
+            file = os.path.abspath(frame.f_code.co_filename)
+            if file.startswith(self.PACKAGE_DIR) and file != os.path.abspath(__file__):
+                module = os.path.splitext(os.path.relpath(file, self.PACKAGE_DIR))[0].replace(os.sep, ".")
+                names.append(f"{module}:{frame.f_code.co_name}")
+                if module.startswith("lowlevelil"):
+                    group = "lifter"
+                elif module in self.DECODER_MODULES:
+                    group = "decoder"
+            frame = frame.f_back
+        if names:
+            return ";".join([group or "plugin", *reversed(names)])
+
+    def dump(self, file: str):
+        # collapsed stacks, as consumed by flamegraph.pl and speedscope
+        with open(file, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def instrument(arch, stats: CallbackStats = None, profiler: SamplingProfiler = None, recorder: TraceRecorder = None,
+               costs: ILCosts = None):
+    # shadows the callbacks on the instance only, so the uninstrumented path costs nothing.
+    # with costs the lifter gets a CountingIL, whose overhead shows up in the recorded latencies
+
+    def timed(callback: str, method, key_of):
+        kind = TRACED_CALLBACKS.get(callback, None)
+
+        def wrapper(*args):
+            if recorder and kind is not None:
+                recorder.record(kind, args[0], args[1])
+            if profiler:
+                profiler.enter()
+            start = perf_counter_ns()
+            try:
+                return method(*args)
+            finally:
+                elapsed = perf_counter_ns() - start
+                if profiler:
+                    profiler.exit()
+                if stats:
+                    stats.record(callback, key_of(*args), elapsed)
+        return wrapper
+
+    def mnemonic(data, addr, *args):
+        instruction = arch.decode(data, addr)
+        return instruction.name if instruction else "undef"
+
+    def write_type(op, size, write_type, *args):
+        return str(write_type)
+
+    def costed(method):
+        def wrapper(data, addr, il, *args):
+            counting = CountingIL(il)
+            try:
+                return method(data, addr, counting, *args)
+            finally:
+                costs.record(mnemonic(data, addr), counting)
+        return wrapper
+
+    for callback in INSTRUMENTED_CALLBACKS:
+        key_of = write_type if callback == "get_flag_write_low_level_il" else mnemonic
+        method = getattr(type(arch), callback).__get__(arch)
+        if costs and callback == "get_instruction_low_level_il":
+            method = costed(method)
+        setattr(arch, callback, timed(callback, method, key_of))
+
+
+def uninstrument(arch):
+    for callback in INSTRUMENTED_CALLBACKS:
+        arch.__dict__.pop(callback, None)
@@ -1,7 +1,7 @@
 from typing import Tuple, List
 from binaryninja import LowLevelILOperation
 from binaryninja import Intrinsic, IntrinsicInfo, IntrinsicInput, Type
-from binaryninja.log import log_warn, log_error, log_debug
+from binaryninja.log import log_error, log_debug
 
 from binaryninja.architecture import (
     FlagType, FlagWriteTypeName,
@@ -24,7 +24,13 @@ from binaryninja.enums import (
 )
 
 from .decoder import Decoder, PowerCategory
-from .lowlevelil import InstLiftTable
+from .diagnostics import Warnings
+from .settings import cache_entries, read_settings
+from .cache import DecodeCache
+from .jumptable import JumpTableResolver
+from .instrumentation import CallbackStats, ILCosts, SamplingProfiler, instrument, uninstrument
+from .lowlevelil import InstLiftTable, MultipleIntrinsics, Options, fused_constant
+from .trace import TraceRecorder
 from .utils import *
 
 
@@ -56,13 +62,18 @@ def get_expr_op(
         raise ValueError
 
 
+# registered PowerVLE instances by architecture name
+PowerVLEInstances = {}
+
+
 class PowerVLE(Architecture):
     name = "power-vle"
     endianness = Endianness.BigEndian
     address_size = 4
     default_int_size = 4
     instr_alignment = 2
-    max_instr_length = 4
+    # 8 so the lifter sees the instruction after an e_lis, see fused_constant
+    max_instr_length = 8
 
     regs = {
         'cr'    : RegisterInfo("cr", 4, 0),
@@ -352,21 +363,123 @@ class PowerVLE(Architecture):
         'mbar'  : IntrinsicInfo([], []),
         'wrteei': IntrinsicInfo([], []),
         #'cntlzw'  : IntrinsicInfo(inputs=[IntrinsicInput(type=Type.int(4, False), name="rs")], outputs=[Type.int(4, False)]),
+
+        # load/store multiple in LiftOptions.multiple == "intrinsic", one output or value input per register
+        **{
+            name: IntrinsicInfo([IntrinsicInput(Type.int(4, False), "ea")], [Type.int(4, False)] * count)
+            if load else
+            IntrinsicInfo([IntrinsicInput(Type.int(4, False), "ea")] +
+                          [IntrinsicInput(Type.int(4, False), f"v{i}") for i in range(count)], [])
+            for name, (load, count) in MultipleIntrinsics.items()
+        },
+
+        # byte-reversed loads and stores in LiftOptions.bswap == "intrinsic", zero extended result
+        'bswap16': IntrinsicInfo([IntrinsicInput(Type.int(2, False), "value")], [Type.int(4, False)]),
+        'bswap32': IntrinsicInfo([IntrinsicInput(Type.int(4, False), "value")], [Type.int(4, False)]),
     }
 
     categories = [PowerCategory.VLE, PowerCategory.B, PowerCategory.SP,
                   PowerCategory.E, PowerCategory.E_CD, PowerCategory.E_CI,
                   PowerCategory.E_CL, PowerCategory.E_PD, PowerCategory.E_PC,
                   PowerCategory.E_PM, PowerCategory.MA, PowerCategory.WT]
+    mode = "SPEenable"
 
     def __init__(self):
         super().__init__()
-        self.decode = Decoder(self.categories)
+        self.settings = read_settings()
+        self.decode = DecodeCache(Decoder(self.categories, self.mode),
+                                  cache_entries(self.settings["powervle.cache.frontBudget"]),
+                                  cache_entries(self.settings["powervle.cache.backBudget"]),
+                                  self.settings["powervle.cache.shards"])
+        Options.update(**{name: self.settings[f"powervle.lift.{name}"] for name in Options.MODES})
+        self.stats = None
+        self.recording = False
+        self.sampler = None
+        self.recorder = None
+        self.costs = None
+        self.costing = False
+        self.jump_tables = JumpTableResolver(self)
+        PowerVLEInstances[self.name] = self
+        if self.settings["powervle.instrumentation.latencies"]:
+            self.enable_instrumentation()
+        if self.settings["powervle.instrumentation.ilCosts"]:
+            self.enable_il_costs()
 
     @classmethod
-    def extend(cls, name: str, categories: PowerCategory):
-        cat = PowerCategory.VLE & categories
-        return type(f"PowerVLE_{name}", (PowerVLE, ), {'name': name, 'categories': cat})
+    def extend(cls, name: str, categories: list[PowerCategory], mode: str = "SPEenable"):
+        return type(f"PowerVLE_{name}", (PowerVLE, ), {'name': name, 'categories': categories, 'mode': mode})
+
+    def enable_instrumentation(self) -> CallbackStats:
+        if self.stats is None:
+            self.stats = CallbackStats()
+        self.recording = True
+        self.reinstrument()
+        return self.stats
+
+    def disable_instrumentation(self):
+        # keeps the collected stats around for dump_instrumentation
+        self.recording = False
+        self.reinstrument()
+
+    def dump_instrumentation(self, file: str):
+        if self.stats is None:
+            raise ValueError("instrumentation was never enabled")
+        self.stats.dump(file)
+
+    def enable_il_costs(self) -> ILCosts:
+        # counts the LLIL each mnemonic's lifter emits
+        if self.costs is None:
+            self.costs = ILCosts()
+        self.costing = True
+        self.reinstrument()
+        return self.costs
+
+    def disable_il_costs(self):
+        self.costing = False
+        self.reinstrument()
+
+    def dump_il_costs(self, file: str):
+        if self.costs is None:
+            raise ValueError("IL cost accounting was never enabled")
+        self.costs.dump(file)
+
+    def start_sampling(self, interval: float = 0.001) -> SamplingProfiler:
+        if self.sampler is None:
+            self.sampler = SamplingProfiler(interval)
+        self.sampler.start()
+        self.reinstrument()
+        return self.sampler
+
+    def stop_sampling(self):
+        if self.sampler is not None:
+            self.sampler.stop()
+            self.reinstrument()
+
+    def dump_sampling(self, file: str):
+        if self.sampler is None:
+            raise ValueError("sampling was never started")
+        self.sampler.dump(file)
+
+    def start_trace(self, file: str) -> TraceRecorder:
+        # records every callback's kind, address and bytes for trace_replay.py
+        self.stop_trace()
+        self.recorder = TraceRecorder(file, self.max_instr_length)
+        self.reinstrument()
+        return self.recorder
+
+    def stop_trace(self):
+        if self.recorder is not None:
+            recorder, self.recorder = self.recorder, None
+            self.reinstrument()
+            recorder.close()
+
+    def reinstrument(self):
+        uninstrument(self)
+        stats = self.stats if self.recording else None
+        sampler = self.sampler if self.sampler and self.sampler.running else None
+        costs = self.costs if self.costing else None
+        if stats or sampler or self.recorder or costs:
+            instrument(self, stats, sampler, self.recorder, costs)
 
     def get_instruction_info(self, data: bytes, addr: int) -> InstructionInfo | None:
 
@@ -434,7 +547,7 @@ class PowerVLE(Architecture):
 
             operand = instruction.get_operand_value(name)
             if operand == None:
-                log_warn(f"instruction {instruction.name} has invalid operand {name}")
+                Warnings.warn("instruction {} has invalid operand {}", instruction.name, name)
                 token = (InstructionTextTokenType.TextToken, f"#INVALID({name})")
             elif name == "target_addr":
                 token = (InstructionTextTokenType.CodeRelativeAddressToken, hex(operand), operand)
@@ -454,7 +567,9 @@ class PowerVLE(Architecture):
             il.append(il.unimplemented())
             return 4
 
-        if instruction.name in InstLiftTable and InstLiftTable[instruction.name]:
+        if instruction.name == "e_lis" and Options.constants == "fuse" and (fused := fused_constant(self.decode, data, addr)):
+            il.append(il.set_reg(4, fused[0], il.const(4, fused[1])))
+        elif instruction.name in InstLiftTable and InstLiftTable[instruction.name]:
             InstLiftTable[instruction.name](instruction, il)
         else:
             il.append(il.unimplemented())
@@ -550,6 +665,33 @@ class PowerVLE(Architecture):
 
         return super().get_flag_write_low_level_il(op, size, write_type, flag, operands, il)
 
+# candidate core variants for detect_variant: name -> (categories, mode)
+PowerVLEVariants = {
+    PowerVLE.name: (PowerVLE.categories, PowerVLE.mode),
+    "power-vle-altivec": ([cat for cat in PowerVLE.categories if cat != PowerCategory.SP] + [PowerCategory.V], "SPEdisable"),
+    "power-vle-base": ([PowerCategory.VLE, PowerCategory.B, PowerCategory.E], "SPEenable"),
+}
+
+
+def variant_arch(name: str) -> PowerVLE:
+    # unregistered instance for the headless tools
+    if name == PowerVLE.name:
+        return PowerVLE()
+    categories, mode = PowerVLEVariants[name]
+    return PowerVLE.extend(name, categories, mode)()
+
+
+def register_variant(name: str) -> Architecture:
+    if name in (arch.name for arch in Architecture):
+        return Architecture[name]
+    categories, mode = PowerVLEVariants[name]
+    PowerVLE.extend(name, categories, mode).register()
+    arch = Architecture[name]
+    arch.register_calling_convention(DefaultCallingConvention(arch, 'default'))
+    arch.standalone_platform.default_calling_convention = arch.calling_conventions['default']
+    return arch
+
+
 class DefaultCallingConvention(CallingConvention):
     name = 'default'
     # dedicated: r1, r2, r13
@@ -0,0 +1,198 @@
+from .instruction import Instruction
+
+
+# values are small expression tuples:
+#   ("in", reg)          register value on entry to the scanned instructions
+#   ("const", value)
+#   ("add", a, b), ("shl", a, amount), ("load", address)
+#   ("unknown", index)   written by an instruction the scan doesn't model
+
+MAX_ENTRIES = 1024
+
+COMPARES = ("e_cmpl16i", "se_cmpli", "e_cmpli", "cmpli")
+
+
+def const(value: int) -> tuple:
+    return ("const", value & 0xffffffff)
+
+
+def add(a: tuple, b: tuple) -> tuple:
+    if a[0] == "const" and b[0] == "const":
+        return const(a[1] + b[1])
+    return ("add", a, b)
+
+
+def evaluate(inst: Instruction, state: dict, index: int):
+    # writes the destination of inst into state, anything unmodelled becomes unknown
+    name = inst.name
+    value = inst.get_operand_value
+    get = lambda reg: state.get(reg, ("in", reg))
+
+    if name == "e_lis":
+        state[value("RT")] = const(value("UI") << 16)
+    elif name == "e_or2i":
+        rt = get(value("RT"))
+        state[value("RT")] = const(rt[1] | value("UI")) if rt[0] == "const" else ("unknown", index)
+    elif name == "e_add16i":
+        state[value("RT")] = add(get(value("RA")), const(value("SI")))
+    elif name == "e_addi":
+        state[value("RT")] = add(get(value("RA")), const(value("sci8")))
+    elif name == "se_addi":
+        state[value("RX")] = add(get(value("RX")), const(value("oimm")))
+    elif name == "se_mr":
+        state[value("RX")] = get(value("RY"))
+    elif name == "se_add":
+        state[value("RX")] = add(get(value("RX")), get(value("RY")))
+    elif name == "add":
+        state[value("RT")] = add(get(value("RA")), get(value("RB")))
+    elif name == "se_slwi":
+        state[value("RX")] = ("shl", get(value("RX")), value("UI5"))
+    elif name == "e_slwi":
+        state[value("RA")] = ("shl", get(value("RS")), value("SH"))
+    elif name == "e_rlwinm" and value("MB") == 0 and value("ME") == 31 - value("SH"):
+        state[value("RA")] = ("shl", get(value("RS")), value("SH"))
+    elif name == "lwzx":
+        state[value("RT")] = ("load", add(get(value("RA")), get(value("RB"))))
+    elif name == "e_lwz":
+        state[value("RT")] = ("load", add(get(value("RA")), const(value("D"))))
+    elif name == "se_lwz":
+        state[value("RZ")] = ("load", add(get(value("RX")), const(value("SD4"))))
+    elif name == "se_mtctr":
+        state["ctr"] = get(value("RX"))
+    elif name == "mtspr" and value("SPR") == "ctr":
+        state["ctr"] = get(value("RS"))
+    elif "cmp" in name or inst.branch or inst.conditional_branch or name.startswith(("e_st", "se_st", "st")):
+        pass
+    elif inst.operands and type(dst := value(inst.operands[0])) == str and dst.startswith("r"):
+        state[dst] = ("unknown", index)
+
+
+def bounds_of(inst: Instruction, state: dict) -> tuple[tuple, int] | None:
+    # unsigned compare against an immediate, the usual guard before the default branch
+    value = inst.get_operand_value
+    get = lambda reg: state.get(reg, ("in", reg))
+    if inst.name == "e_cmpl16i":
+        return get(value("RA")), value("UI")
+    if inst.name == "se_cmpli":
+        return get(value("RX")), value("oimm")
+    if inst.name == "e_cmpli":
+        return get(value("RA")), value("sci8")
+    return None
+
+
+def match_table(ctr: tuple) -> tuple[int, tuple, bool] | None:
+    # (table address, index value, relative) for ctr = load(table + (index << 2)),
+    # or, for position independent tables, load(table + (index << 2)) + table
+    relative = False
+    if ctr[0] == "add" and ctr[1][0] == "load" and ctr[2][0] == "const":
+        ctr, base, relative = ctr[1], ctr[2][1], True
+    if ctr[0] != "load" or ctr[1][0] != "add":
+        return None
+    a, b = ctr[1][1], ctr[1][2]
+    if a[0] == "shl":
+        a, b = b, a
+    if a[0] != "const" or b[0] != "shl" or b[2] != 2:
+        return None
+    if relative and base != a[1]:
+        return None
+    return a[1], b[1], relative
+
+
+def recognize(instructions: list[Instruction]) -> tuple[int, int, bool] | None:
+    # instructions leading up to and including the se_bctr, oldest first.
+    # returns (table address, entry count, relative)
+    state = {}
+    bounds = {}
+    for index, inst in enumerate(instructions[:-1]):
+        if inst.name in COMPARES and (bound := bounds_of(inst, state)):
+            bounds[bound[0]] = bound[1]
+        evaluate(inst, state, index)
+
+    if not instructions or instructions[-1].name != "se_bctr" or "ctr" not in state:
+        return None
+    if (match := match_table(state["ctr"])) is None:
+        return None
+    table, index, relative = match
+    if index not in bounds:
+        return None
+    # the guard branches to the default case above the bound, so the bound itself is a valid index
+    return table, min(bounds[index] + 1, MAX_ENTRIES), relative
+
+
+def read_targets(read, is_code, table: int, count: int, relative: bool) -> list[int]:
+    # stops at the first entry which doesn't point at code, tables are often followed by data
+    targets = []
+    for i in range(count):
+        entry = read(table + 4 * i, 4)
+        if len(entry) < 4:
+            break
+        target = int.from_bytes(entry, "big")
+        if relative:
+            target = (target + table) & 0xffffffff
+        if target & 1 or not is_code(target):
+            break
+        targets.append(target)
+    return targets
+
+
+class JumpTableResolver:
+    # finds se_bctr jump tables in binary ninja functions and sets them as user indirect branches.
+    # resolved tables are kept per se_bctr address in the view's session data. blocks without a table
+    # are scanned again on the next pass, setting targets exposes new blocks and predecessors
+
+    SESSION_KEY = "powervle.jump_tables"
+    APPLIED_KEY = "powervle.jump_tables.applied"
+
+    def __init__(self, arch):
+        self.arch = arch
+
+    def block_instructions(self, bv, block) -> list[Instruction]:
+        instructions = []
+        addr = block.start
+        while addr < block.end:
+            if (inst := self.arch.decode(bv.read(addr, 4), addr)) is None:
+                break
+            instructions.append(inst)
+            addr += inst.length
+        return instructions
+
+    def candidates(self, bv, block) -> list[Instruction]:
+        # only the last halfword is decoded until the block is known to end in se_bctr.
+        # the bound check usually ends the only predecessor block, which is only decoded for those blocks
+        last = self.arch.decode(bv.read(block.end - 2, 2), block.end - 2)
+        if last is None or last.name != "se_bctr" or last.get_operand_value("LK"):
+            return []
+        instructions = self.block_instructions(bv, block)
+        if not instructions or instructions[-1].name != "se_bctr" or instructions[-1].get_operand_value("LK"):
+            return []
+        if len(block.incoming_edges) == 1:
+            instructions = self.block_instructions(bv, block.incoming_edges[0].source) + instructions
+        return instructions
+
+    def session(self, bv, key: str, factory):
+        if (value := bv.session_data.get(key, None)) is None:
+            value = bv.session_data[key] = factory()
+        return value
+
+    def resolve(self, bv, func) -> dict[int, list[int]]:
+        cache = self.session(bv, self.SESSION_KEY, dict)
+        tables = {}
+        is_code = lambda addr: bv.is_offset_executable(addr)
+        for block in func.basic_blocks:
+            # se_bctr is 2 bytes and always ends its block
+            if (targets := cache.get(block.end - 2, None)) is not None:
+                tables[block.end - 2] = targets
+                continue
+            instructions = self.candidates(bv, block)
+            if instructions and (found := recognize(instructions)) and (targets := read_targets(bv.read, is_code, *found)):
+                tables[instructions[-1].addr] = cache[instructions[-1].addr] = targets
+        return tables
+
+    def apply(self, bv, func) -> int:
+        # number of tables set by this call, tables applied before are left alone
+        applied = self.session(bv, self.APPLIED_KEY, set)
+        tables = {addr: targets for addr, targets in self.resolve(bv, func).items() if addr not in applied}
+        for addr, targets in tables.items():
+            func.set_user_indirect_branches(addr, [(func.arch, target) for target in targets])
+            applied.add(addr)
+        return len(tables)
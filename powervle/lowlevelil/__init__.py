@@ -1,31 +1,91 @@
+from importlib import import_module
 from typing import Callable
 
 from binaryninja.lowlevelil import LowLevelILFunction
 
 from ..instruction import Instruction
 
-from .logical import lift_logical_instructions
-from .shift import lift_shift_instructions
-from .arithmetic import lift_add_instructions, lift_sub_instructions, lift_mul_instructions
-from .compare import lift_compare_instructions
-from .load import lift_load_instructions
-from .move_sysreg import lift_move_sysreg_instructions
-from .store import lift_store_instructions
-from .multiple import lift_multiple_instructions
-from .branch import lift_branch_instructions, lift_cond_branch_instructions, lift_indirect_branch_instructions
-
-from .load_b import lift_b_load_instructions
-from .arithmetic_b import (lift_b_add_instructions, lift_b_sub_instructions, 
-lift_b_neg_instructions, lift_b_mul_instructions, lift_b_div_instructions)
-from .compare_b import lift_b_compare_instructions
-from .logical_b import lift_b_logical_instructions
-from .shift_b import lift_b_shift_instructions
-from .efpu import lift_efpu_instructions
-from .select import lift_select_instructions
-from .clz import lift_clz_instructions
+from .options import LiftOptions, MultipleIntrinsics, MultipleTransfers, Options
 
 InstLiftFuncType = Callable[[Instruction, LowLevelILFunction], None] 
 
+# mnemonics which lift to a return, what the headless tools split functions at
+RETURNS = ("se_blr", "se_rfi", "se_rfci", "se_rfdi", "se_rfmci")
+
+
+class LazyLifter:
+    # stands in for a lifter until its first call, which imports the lifter module and
+    # puts the real function in InstLiftTable for every mnemonic routed to it
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+
+    def resolve(self) -> InstLiftFuncType:
+        func = getattr(import_module(self.module, __name__), self.name)
+        for mnemonic, lifter in InstLiftTable.items():
+            if lifter is self:
+                InstLiftTable[mnemonic] = func
+        return func
+
+    def __call__(self, inst: Instruction, il: LowLevelILFunction) -> None:
+        return self.resolve()(inst, il)
+
+
+class LazyFunction:
+    # a helper the architecture calls directly, imported on its first call like the lifters
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.func = None
+
+    def resolve(self) -> Callable:
+        if self.func is None:
+            self.func = getattr(import_module(self.module, __name__), self.name)
+        return self.func
+
+    def __call__(self, *args):
+        return (self.func or self.resolve())(*args)
+
+
+fused_constant = LazyFunction(".fusion", "fused_constant")
+
+
+def resolve_lifters():
+    # imports every lifter module up front, e.g. before timing lifts
+    for lifter in set(InstLiftTable.values()):
+        if isinstance(lifter, LazyLifter):
+            lifter.resolve()
+    fused_constant.resolve()
+
+
+lift_logical_instructions         = LazyLifter(".logical", "lift_logical_instructions")
+lift_shift_instructions           = LazyLifter(".shift", "lift_shift_instructions")
+lift_add_instructions             = LazyLifter(".arithmetic", "lift_add_instructions")
+lift_sub_instructions             = LazyLifter(".arithmetic", "lift_sub_instructions")
+lift_mul_instructions             = LazyLifter(".arithmetic", "lift_mul_instructions")
+lift_compare_instructions         = LazyLifter(".compare", "lift_compare_instructions")
+lift_load_instructions            = LazyLifter(".load", "lift_load_instructions")
+lift_move_sysreg_instructions     = LazyLifter(".move_sysreg", "lift_move_sysreg_instructions")
+lift_store_instructions           = LazyLifter(".store", "lift_store_instructions")
+lift_multiple_instructions        = LazyLifter(".multiple", "lift_multiple_instructions")
+lift_branch_instructions          = LazyLifter(".branch", "lift_branch_instructions")
+lift_cond_branch_instructions     = LazyLifter(".branch", "lift_cond_branch_instructions")
+lift_indirect_branch_instructions = LazyLifter(".branch", "lift_indirect_branch_instructions")
+lift_b_load_instructions          = LazyLifter(".load_b", "lift_b_load_instructions")
+lift_b_add_instructions           = LazyLifter(".arithmetic_b", "lift_b_add_instructions")
+lift_b_sub_instructions           = LazyLifter(".arithmetic_b", "lift_b_sub_instructions")
+lift_b_neg_instructions           = LazyLifter(".arithmetic_b", "lift_b_neg_instructions")
+lift_b_mul_instructions           = LazyLifter(".arithmetic_b", "lift_b_mul_instructions")
+lift_b_div_instructions           = LazyLifter(".arithmetic_b", "lift_b_div_instructions")
+lift_b_compare_instructions       = LazyLifter(".compare_b", "lift_b_compare_instructions")
+lift_b_logical_instructions       = LazyLifter(".logical_b", "lift_b_logical_instructions")
+lift_b_shift_instructions         = LazyLifter(".shift_b", "lift_b_shift_instructions")
+lift_efpu_instructions            = LazyLifter(".efpu", "lift_efpu_instructions")
+lift_select_instructions          = LazyLifter(".select", "lift_select_instructions")
+lift_clz_instructions             = LazyLifter(".clz", "lift_clz_instructions")
+
 
 InstLiftTable: dict[str, InstLiftFuncType] = {
     "se_illegal" : lambda inst, il: il.append(il.undefined()),
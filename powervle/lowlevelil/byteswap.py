@@ -0,0 +1,70 @@
+from binaryninja.lowlevelil import LowLevelILFunction, ExpressionIndex, LLIL_TEMP
+from .options import Options
+
+
+def byte_reverse_plan(size: int) -> tuple[tuple[int, int], ...]:
+    # (left shift, negative for right, mask or 0) per source byte at size width.
+    # the byte shifted to either end needs no mask, the shift already drops its neighbours
+    plan = []
+    for src_idx in range(size):
+        dst_idx = size - src_idx - 1
+        shift = (dst_idx - src_idx) * 8
+        mask = 0 if dst_idx in (0, size - 1) else 0xff << (dst_idx * 8)
+        plan.append((shift, mask))
+    return tuple(plan)
+
+
+SwapPlans = {size: byte_reverse_plan(size) for size in (2, 4)}
+
+
+def byte_reverse_register(il: LowLevelILFunction, reg, size: int) -> ExpressionIndex:
+    # low size bytes of reg reversed, size wide
+    swap = None
+
+    for shift, mask in SwapPlans[size]:
+        ei0 = il.reg(size, reg)
+        if shift > 0:
+            ei0 = il.shift_left(size, ei0, il.const(1, shift))
+        elif shift < 0:
+            ei0 = il.logical_shift_right(size, ei0, il.const(1, -shift))
+        if mask:
+            ei0 = il.and_expr(size, ei0, il.const(size, mask))
+
+        if swap == None:
+            swap = ei0
+        else:
+            swap = il.or_expr(size, swap, ei0)
+
+    return swap
+
+
+def lift_byte_reverse(il: LowLevelILFunction, dst, src, size: int) -> None:
+    # dst = zero extended byte reverse of the low size bytes of src
+    if Options.bswap == "intrinsic":
+        il.append(il.intrinsic([dst], f"bswap{size * 8}", [il.reg(size, src)]))
+        return
+
+    swap = byte_reverse_register(il, src, size)
+    if size < il.arch.address_size:
+        swap = il.zero_extend(il.arch.address_size, swap)
+    il.append(il.set_reg(il.arch.address_size, dst, swap))
+
+
+def lift_byte_reversed_load(il: LowLevelILFunction, dst, EA: ExpressionIndex, size: int) -> None:
+    if Options.bswap == "intrinsic":
+        il.append(il.intrinsic([dst], f"bswap{size * 8}", [il.load(size, EA)]))
+        return
+
+    ei0 = il.load(size, EA)
+    if size < il.arch.address_size:
+        ei0 = il.zero_extend(il.arch.address_size, ei0)
+    il.append(il.set_reg(il.arch.address_size, dst, ei0))
+    lift_byte_reverse(il, dst, dst, size)
+
+
+def byte_reversed_register(il: LowLevelILFunction, reg, size: int) -> ExpressionIndex:
+    # value to store, the intrinsic result goes through a temporary since intrinsics are statements
+    if Options.bswap == "intrinsic":
+        lift_byte_reverse(il, LLIL_TEMP(0), reg, size)
+        return il.reg(size, LLIL_TEMP(0))
+    return byte_reverse_register(il, reg, size)
@@ -0,0 +1,30 @@
+from ..cache import DecodeCache
+
+
+# (e_lis word, next word) -> (register, constant) or None when the pair doesn't fuse
+FusedPairs = {}
+FUSED_PAIRS_SIZE = 1 << 12
+
+
+def fused_constant(decode: DecodeCache, data: bytes, addr: int) -> tuple[str, int] | None:
+    # e_lis rX, hi followed by e_or2i rX, lo materializes rX = hi << 16 | lo at the e_lis.
+    # the e_or2i is still lifted on its own, or-ing lo in again leaves the value unchanged,
+    # so a branch straight to it stays correct. adding isn't idempotent, e_add16i/e_add2i/se_addi
+    # pairs would count lo twice and are left to dataflow.
+    key = data[:8]
+    if len(key) < 8:
+        return None
+    if (fused := FusedPairs.get(key, key)) is not key:
+        return fused
+
+    fused = None
+    first, second = decode(data, addr), decode(data[4:], addr + 4)
+    if first and second and first.name == "e_lis" and second.name == "e_or2i":
+        rt = first.get_operand_value("RT")
+        if second.get_operand_value("RT") == rt:
+            fused = (rt, (first.get_operand_value("UI") << 16) | second.get_operand_value("UI"))
+
+    if len(FusedPairs) >= FUSED_PAIRS_SIZE:
+        FusedPairs.clear()
+    FusedPairs[key] = fused
+    return fused
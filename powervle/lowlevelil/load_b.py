@@ -1,29 +1,7 @@
 from binaryninja.lowlevelil import LowLevelILFunction, ExpressionIndex
 from ..instruction import Instruction
 from binaryninja.log import log_warn, log_error, log_debug
-
-def byte_reverse_register(il: LowLevelILFunction, reg: str, size: int) -> ExpressionIndex:
-    swap = None
-
-    for src_idx in range(size):
-        ei0 = il.reg(4, reg)
-        dst_idx = size - src_idx - 1
-
-        if dst_idx > src_idx:
-            mask = il.const(4, 0xff << (src_idx * 8))
-            ei0 = il.And(4, ei0, mask)
-            ei0 = il.shift_left(4, ei0, il.const(4, (dst_idx - src_idx) * 8))
-        elif src_idx > dst_idx:
-            mask = il.const(4, 0xff << (dst_idx * 8))
-            ei0 = il.logical_shift_right(4, ei0, il.const(4, (src_idx - dst_idx) * 8))
-            ei0 = il.And(4, ei0, mask)
-        
-        if swap == None:
-            swap = ei0
-        else:
-            swap = il.or_expr(4, swap, ei0)
-    
-    return swap
+from .byteswap import lift_byte_reversed_load
 
 def lift_b_load_instructions(inst: Instruction, il: LowLevelILFunction) -> None:
     for i in range(len(inst.operands)):
@@ -87,20 +65,9 @@ def lift_b_load_instructions(inst: Instruction, il: LowLevelILFunction) -> None:
 
         EA = il.add(il.arch.address_size, il.reg(il.arch.address_size, ra), il.reg(il.arch.address_size, rb))
         if inst.name == "lhbrx":
-            ei0 = il.load(2, EA)
-            ei0 = il.zero_extend(il.arch.address_size, ei0)
-        else:
-            ei0 = il.load(4, EA)
-
-        ei0 = il.set_reg(il.arch.address_size, rt, ei0)
-        il.append(ei0)
-
-        if inst.name == "lhbrx":
-            swap = byte_reverse_register(il, rt, 2)
+            lift_byte_reversed_load(il, rt, EA, 2)
         else:
-            swap = byte_reverse_register(il, rt, 4)
-
-        il.append(il.set_reg(il.arch.address_size, rt, swap))
+            lift_byte_reversed_load(il, rt, EA, 4)
 
     # cache bypass decoration load word: InstX("lwdcbx", "B", ["RT", "RA", "RB"])
     elif inst.name == "lwdcbx":
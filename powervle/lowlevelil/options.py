@@ -0,0 +1,60 @@
+class LiftOptions:
+    # trades IL size against explicit semantics, read by the lifters on every call
+    #   multiple: "expand"    one load or store per register of e_lmw, e_stmw, e_lmv*, e_stmv*
+    #             "intrinsic" one intrinsic per instruction
+    #   bswap:    "expand"    shift/and/or per byte of lhbrx, lwbrx, sthbrx, stwbrx
+    #             "intrinsic" bswap16/bswap32 intrinsic
+    #   constants: "fuse"     e_lis sets the whole constant when e_or2i on the same register follows
+    #              "split"    e_lis sets the high half only
+    MODES = {
+        "multiple": ("expand", "intrinsic"),
+        "bswap": ("expand", "intrinsic"),
+        "constants": ("fuse", "split"),
+    }
+
+    def __init__(self, **options):
+        self.multiple = "expand"
+        self.bswap = "expand"
+        self.constants = "fuse"
+        self.update(**options)
+
+    def update(self, **options):
+        for name, mode in options.items():
+            if name not in self.MODES:
+                raise ValueError(f"unknown lift option {name}")
+            if mode not in self.MODES[name]:
+                raise ValueError(f"lift option {name} must be one of {', '.join(self.MODES[name])}, not {mode}")
+            setattr(self, name, mode)
+
+    def to_dict(self) -> dict[str, str]:
+        return {name: getattr(self, name) for name in self.MODES}
+
+
+Options = LiftOptions()
+
+
+# name -> (load, registers in transfer order, or None for RT/RS..r31)
+MultipleTransfers = {
+    "e_lmw"       : (True, None),
+    "e_stmw"      : (False, None),
+    "e_lmvgprw"   : (True, ["r0"] + [f"r{i}" for i in range(3, 13)]),
+    "e_stmvgprw"  : (False, ["r0"] + [f"r{i}" for i in range(3, 13)]),
+    "e_lmvsprw"   : (True, ["cr", "lr", "ctr", "xer"]),
+    "e_stmvsprw"  : (False, ["cr", "lr", "ctr", "xer"]),
+    "e_lmvsrrw"   : (True, ["srr0", "srr1"]),
+    "e_stmvsrrw"  : (False, ["srr0", "srr1"]),
+    "e_lmvcsrrw"  : (True, ["csrr0", "csrr1"]),
+    "e_stmvcsrrw" : (False, ["csrr0", "csrr1"]),
+    "e_lmvdsrrw"  : (True, ["dsrr0", "dsrr1"]),
+    "e_stmvdsrrw" : (False, ["dsrr0", "dsrr1"]),
+    "e_lmvmcsrrw" : (True, ["mcsrr0", "mcsrr1"]),
+    "e_stmvmcsrrw": (False, ["mcsrr0", "mcsrr1"]),
+}
+
+# intrinsic name -> (load, register count). e_lmw and e_stmw move RT..r31, so there is
+# one intrinsic per first register and each declares the number of registers it moves
+MultipleIntrinsics = {
+    **{name: (load, len(regs)) for name, (load, regs) in MultipleTransfers.items() if regs != None},
+    **{f"{name}_r{first}": (load, 32 - first)
+       for name, (load, regs) in MultipleTransfers.items() if regs == None for first in range(32)},
+}
@@ -1,28 +1,6 @@
 from binaryninja.lowlevelil import LowLevelILFunction, ExpressionIndex
 from ..instruction import Instruction
-
-def byte_reverse_register(il: LowLevelILFunction, reg: str, size: int) -> ExpressionIndex:
-    swap = None
-
-    for src_idx in range(size):
-        ei0 = il.reg(4, reg)
-        dst_idx = size - src_idx - 1
-
-        if dst_idx > src_idx:
-            mask = il.const(4, 0xff << (src_idx * 8))
-            ei0 = il.And(4, ei0, mask)
-            ei0 = il.shift_left(4, ei0, il.const(4, (dst_idx - src_idx) * 8))
-        elif src_idx > dst_idx:
-            mask = il.const(4, 0xff << (dst_idx * 8))
-            ei0 = il.logical_shift_right(4, ei0, il.const(4, (src_idx - dst_idx) * 8))
-            ei0 = il.And(4, ei0, mask)
-        
-        if swap == None:
-            swap = ei0
-        else:
-            swap = il.or_expr(4, swap, ei0)
-    
-    return swap
+from .byteswap import byte_reversed_register
 
 def lift_store_instructions(inst: Instruction, il: LowLevelILFunction) -> None:
     for i in range(len(inst.operands)):
@@ -146,10 +124,10 @@ def lift_store_instructions(inst: Instruction, il: LowLevelILFunction) -> None:
 
         EA = il.add(il.arch.address_size, il.reg(il.arch.address_size, ra), il.reg(il.arch.address_size, rb))
         if inst.name == "sthbrx":
-            swap = byte_reverse_register(il, rs, 2)
-            ei0 = il.store(2, EA, ei0)
+            swap = byte_reversed_register(il, rs, 2)
+            ei0 = il.store(2, EA, swap)
         else:
-            swap = byte_reverse_register(il, rs, 4)
+            swap = byte_reversed_register(il, rs, 4)
             ei0 = il.store(4, EA, swap)
         
         il.append(ei0)       
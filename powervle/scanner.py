@@ -0,0 +1,165 @@
+from collections import Counter
+from math import log2
+
+from .cursor import DecodeCursor
+from .decoder import Decoder
+from .lowlevelil import InstLiftTable
+
+
+def is_branch(inst_cls) -> bool:
+    # branch flags are plain class attributes on branch classes, properties elsewhere
+    return inst_cls.branch is True or inst_cls.conditional_branch is True
+
+
+class WindowScore:
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.valid = 0.0
+        self.lifted = 0.0
+        self.branches = None
+        self.entropy = 0.0
+        self.score = 0.0
+
+
+def score_window(decoder: Decoder, data, base: int, start: int, end: int) -> WindowScore:
+    window = WindowScore(base + start, base + end)
+    cursor = DecodeCursor(decoder, data, start, base + start)
+    target = DecodeCursor(decoder, data, 0, base)
+
+    covered = lifted = branches = consistent = 0
+    names = Counter()
+    while cursor.offset < end and cursor.offset + 2 <= cursor.size:
+        if cursor.valid:
+            covered += cursor.length
+            names[cursor.name] += 1
+            lifted += cursor.name in InstLiftTable
+            if is_branch(cursor.inst_cls):
+                addr = cursor.instruction().get_operand_value("target_addr")
+                if addr != None:
+                    branches += 1
+                    if 0 <= addr - base < len(data) and not addr & 1:
+                        target.seek(addr - base)
+                        consistent += target.valid
+        cursor.advance()
+
+    count = sum(names.values())
+    window.valid = min(covered / (end - start), 1.0)
+    window.lifted = lifted / count if count else 0.0
+    window.branches = consistent / branches if branches else None
+    if count > 1:
+        entropy = -sum(n / count * log2(n / count) for n in names.values())
+        window.entropy = max(entropy / log2(count), 0.0)
+
+    # real code decodes almost everywhere, so a few undecodable halfwords weigh a lot.
+    # constant fills decode as one repeated mnemonic, which the entropy factor zeroes.
+    valid_score = window.valid ** 8
+    branch_score = window.branches if window.branches != None else valid_score
+    window.score = (0.45 * valid_score + 0.25 * window.lifted + 0.3 * branch_score) * min(window.entropy / 0.25, 1.0)
+    return window
+
+
+def score_windows(decoder: Decoder, data, base: int = 0, window: int = 0x100) -> list[WindowScore]:
+    return [score_window(decoder, data, base, start, min(start + window, len(data)))
+            for start in range(0, len(data), window)]
+
+
+def region_map(windows: list[WindowScore], threshold: float = 0.7) -> list[dict]:
+    regions = []
+    for window in windows:
+        kind = "code" if window.score >= threshold else "data"
+        if regions and regions[-1]["kind"] == kind and regions[-1]["end"] == window.start:
+            region = regions[-1]
+            region["score"] = (region["score"] * region["windows"] + window.score) / (region["windows"] + 1)
+            region["windows"] += 1
+            region["end"] = window.end
+        else:
+            regions.append({"start": window.start, "end": window.end, "kind": kind, "score": window.score, "windows": 1})
+    return regions
+
+
+def detect_variant(candidates: dict[str, tuple[list, str]], data, base: int = 0,
+                   window: int = 0x100, samples: int = 64, threshold: float = 0.7) -> list[dict]:
+    decoders = {}
+    ranking = []
+    for name, (categories, mode) in candidates.items():
+        try:
+            decoders[name] = Decoder(categories, mode)
+        except ValueError as e:
+            # category tables which cannot be merged with the base map
+            ranking.append({"name": name, "error": str(e), "score": 0.0})
+
+    # one pass over evenly spaced sample windows, every candidate scores the same window
+    step = max(window, len(data) // samples // window * window)
+    totals = {name: {"score": 0.0, "valid": 0.0, "lifted": 0.0, "branches": 0.0, "windows": 0} for name in decoders}
+    for start in range(0, len(data), step):
+        end = min(start + window, len(data))
+        scores = {name: score_window(decoder, data, base, start, end) for name, decoder in decoders.items()}
+        # data windows look alike under every candidate and only blur the ranking
+        if max(w.score for w in scores.values()) < threshold:
+            continue
+        for name, w in scores.items():
+            total = totals[name]
+            total["score"] += w.score
+            total["valid"] += w.valid
+            total["lifted"] += w.lifted
+            total["branches"] += w.branches if w.branches != None else w.valid
+            total["windows"] += 1
+
+    for name, total in totals.items():
+        count = total.pop("windows")
+        ranking.append({"name": name, "windows": count, **{k: v / count if count else 0.0 for k, v in total.items()}})
+
+    ranking.sort(key=lambda entry: entry["score"], reverse=True)
+    return ranking
+
+
+def sweep(decoder: Decoder, data, base: int = 0, max_divergence: int = 64) -> list[tuple[int, type | None]]:
+    # follows both halfword phases at once and keeps the one which decodes validly and
+    # lands on branch targets until the phases converge again.
+    # returns (offset, instruction class or None for an undecodable halfword)
+    cursor = DecodeCursor(decoder, data, 0, base)
+    count = len(data) // 2
+    classes = [None] * count
+    steps = [1] * count
+    targets = set()
+    for i in range(count):
+        cursor.seek(i * 2)
+        if cursor.valid:
+            classes[i] = cursor.inst_cls
+            steps[i] = cursor.length // 2
+            if is_branch(cursor.inst_cls):
+                addr = cursor.instruction().get_operand_value("target_addr")
+                if addr != None and 0 <= addr - base < len(data) and not addr & 1:
+                    targets.add((addr - base) // 2)
+
+    def score(chain: list[int]) -> int:
+        return sum(2 if i in targets else 0 if classes[i] else -4 for i in chain)
+
+    result = []
+    pos = 0
+    while pos < count:
+        a, b = pos, pos + 1
+        chain_a, chain_b = [], []
+        while a != b and min(a, b) < count and max(a, b) - pos < max_divergence:
+            if a < b:
+                chain_a.append(a)
+                a += steps[a]
+            else:
+                chain_b.append(b)
+                b += steps[b]
+
+        # on convergence both phases continue from the same halfword, otherwise
+        # the better phase is kept and both are followed again from its end.
+        # leaving the current phase needs an invalid decode in it or two more branch targets
+        margin = 0 if any(classes[i] is None for i in chain_a) else 4
+        if chain_b and score(chain_b) > score(chain_a) + margin:
+            # the halfword skipped by the other phase is data
+            result.append((pos * 2, None))
+            result.extend((i * 2, classes[i]) for i in chain_b)
+            pos = b
+        else:
+            result.extend((i * 2, classes[i]) for i in chain_a)
+            pos = a
+    return result
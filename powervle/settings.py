@@ -0,0 +1,98 @@
+import json
+
+from binaryninja.settings import Settings
+
+from .cache import ENTRY_BYTES
+from .lowlevelil import LiftOptions
+
+
+SETTINGS_GROUP = "powervle"
+
+# binary ninja settings schema per key, read once by each PowerVLE instance.
+# there is no strict decoding switch: the decode tables match opcode fields only and never
+# check reserved bits, so there is no stricter mode to select yet
+PowerVLESettings = {
+    "powervle.cache.frontBudget": {
+        "title": "Decode cache budget per thread (KiB)",
+        "type": "number", "default": 1024 * ENTRY_BYTES // 1024, "minValue": 0, "maxValue": 1 << 20,
+        "description": "Memory for each analysis thread's front decode cache, 0 disables it.",
+    },
+    "powervle.cache.backBudget": {
+        "title": "Shared decode cache budget (KiB)",
+        "type": "number", "default": (1 << 15) * ENTRY_BYTES // 1024, "minValue": 0, "maxValue": 1 << 22,
+        "description": "Memory for the decode cache shared between analysis threads.",
+    },
+    "powervle.cache.shards": {
+        "title": "Shared decode cache shards",
+        "type": "number", "default": 16, "minValue": 1, "maxValue": 256,
+        "description": "Lock stripes of the shared decode cache, more shards mean less contention.",
+    },
+    "powervle.warmup.enabled": {
+        "title": "Warm up after loading",
+        "type": "boolean", "default": True,
+        "description": "Compile the flattened decode tables and import the lifters on a background thread.",
+    },
+    **{
+        f"powervle.lift.{name}": {
+            "title": f"Lift mode for {name}",
+            "type": "string", "default": getattr(LiftOptions(), name), "enum": list(modes),
+            "description": "Compact modes emit intrinsics or pre-computed values, expanded ones spell the semantics out.",
+        }
+        for name, modes in LiftOptions.MODES.items()
+    },
+    "powervle.instrumentation.latencies": {
+        "title": "Record callback latencies from start",
+        "type": "boolean", "default": False,
+        "description": "Same as POWER VLE > Instrumentation > Enable, without waiting for the command.",
+    },
+    "powervle.instrumentation.ilCosts": {
+        "title": "Count emitted IL from start",
+        "type": "boolean", "default": False,
+        "description": "Same as POWER VLE > Instrumentation > Enable IL costs.",
+    },
+    "powervle.instrumentation.statsPath": {
+        "title": "Callback statistics file",
+        "type": "string", "default": "power-vle-callbacks.json",
+        "description": "Suggested file for Dump statistics.",
+    },
+    "powervle.instrumentation.ilCostsPath": {
+        "title": "IL costs file",
+        "type": "string", "default": "power-vle-il-costs.json",
+        "description": "Suggested file for Dump IL costs.",
+    },
+    "powervle.instrumentation.stacksPath": {
+        "title": "Collapsed stacks file",
+        "type": "string", "default": "power-vle-stacks.txt",
+        "description": "Suggested file for Dump collapsed stacks.",
+    },
+    "powervle.instrumentation.tracePath": {
+        "title": "Callback trace file",
+        "type": "string", "default": "power-vle.pvtr",
+        "description": "Suggested file for Trace > Start recording.",
+    },
+}
+
+registered = False
+
+
+def register_settings():
+    global registered
+    if registered:
+        return
+    settings = Settings()
+    settings.register_group(SETTINGS_GROUP, "POWER VLE")
+    for key, properties in PowerVLESettings.items():
+        # read when an architecture is created, so a change applies after a restart
+        settings.register_setting(key, json.dumps({**properties, "requiresRestart": True}))
+    registered = True
+
+
+def read_settings() -> dict:
+    register_settings()
+    settings = Settings()
+    getters = {"boolean": settings.get_bool, "number": settings.get_integer, "string": settings.get_string}
+    return {key: getters[properties["type"]](key) for key, properties in PowerVLESettings.items()}
+
+
+def cache_entries(budget: int) -> int:
+    return budget * 1024 // ENTRY_BYTES
@@ -0,0 +1,144 @@
+import lzma
+import random
+
+from .cursor import DecodeCursor
+from .decoder import Decoder, path_mask
+from .instruction import Instruction
+from .tables import DecodeTables
+
+
+# golden decode results, one record per word:
+#   word \t name \t length \t operand values \t simplified text     ("-" for undecodable words)
+# the words of a category set are every halfword (low half zero) plus a stratified sample of
+# every leaf of the decode tree; checks decode the stored words again, so the sample is fixed
+FORMAT = "power-vle decode snapshot 1"
+SNAPSHOT_ADDR = 0x1000
+
+
+def render(inst: Instruction) -> str:
+    operands = []
+    for name in inst.simplified_operands:
+        value = inst.get_operand_value(name)
+        operands.append(f"#INVALID({name})" if value == None else value if type(value) == str else hex(value))
+    return f"{inst.simplified_mnemonic} {', '.join(operands)}".rstrip()
+
+
+def describe(inst: Instruction | None) -> str:
+    if inst is None:
+        return "-"
+    operands = ",".join(f"{name}={inst.get_operand_value(name)}" for name in inst.operands)
+    return f"{inst.name}\t{inst.length}\t{operands}\t{render(inst)}"
+
+
+def sample_words(decoder: Decoder, per_leaf: int = 8, seed: int = 0) -> list[int]:
+    # opcode bits fixed by the leaf's path, every other bit all zero, all one and per_leaf times random
+    words = {w << 16 for w in range(0x10000)}
+    for path, inst_cls in decoder.map.leaves():
+        mask, value = path_mask(path)
+        rng = random.Random(f"{seed}:{path}")
+        words.add(value)
+        words.add(value | (~mask & 0xffffffff))
+        words.update(value | (rng.getrandbits(32) & ~mask) for _ in range(per_leaf))
+    return sorted(words)
+
+
+def decode_words(decoder: Decoder, words: list[int]) -> dict[int, str]:
+    return {word: describe(decoder.decode(word.to_bytes(4, "big"), SNAPSHOT_ADDR)) for word in words}
+
+
+def cursor_words(decoder: Decoder, words: list[int]) -> dict[int, str]:
+    return {word: describe(DecodeCursor(decoder, word.to_bytes(4, "big"), 0, SNAPSHOT_ADDR).instruction()) for word in words}
+
+
+def lookup_paths(decoder: Decoder, words: list[int]) -> dict:
+    # path name -> words -> records, each one decodes through another lookup of the same category set
+    categories, mode = decoder.categories, decoder.mode
+    # serialized and read back the way attached workers get them
+    tables = DecodeTables.from_buffer(DecodeTables.compile(decoder).to_bytes(), categories, mode)
+    with_tables = Decoder(categories, mode, tables=tables)
+
+    # every leaf the words reach goes into the fast table, so the tree only sees undecodable words
+    profiled = Decoder(categories, mode)
+    profiled.start_profile()
+    for word in words:
+        profiled.lookup(word)
+    layout = profiled.layout(profiled.stop_profile(), limit=len(words), min_share=0)
+    profiled.fast = {primary: [(*path_mask(path), inst_cls) for _, path, inst_cls in entries] for primary, entries in layout.items()}
+    profiled.reset_lookup()
+
+    return {
+        "tree": lambda words: decode_words(decoder, words),
+        "tables": lambda words: decode_words(with_tables, words),
+        "profile": lambda words: decode_words(profiled, words),
+        "cursor": lambda words: cursor_words(decoder, words),
+    }
+
+
+def generate(candidates: dict[str, tuple[list, str]], per_leaf: int = 8, seed: int = 0) -> dict[str, dict[int, str] | str]:
+    # category set name -> records, or the error message when the set cannot be built
+    snapshot = {}
+    for name, (categories, mode) in candidates.items():
+        try:
+            decoder = Decoder(categories, mode)
+        except ValueError as e:
+            snapshot[name] = str(e)
+            continue
+        snapshot[name] = decode_words(decoder, sample_words(decoder, per_leaf, seed))
+    return snapshot
+
+
+def check(snapshot: dict[str, dict[int, str] | str], candidates: dict[str, tuple[list, str]]) -> list[tuple]:
+    # every set is decoded through each lookup path against the same records.
+    # returns (set name and path, word or None, expected, actual) for every difference
+    diffs = []
+    for name in sorted(snapshot.keys() | candidates.keys()):
+        if name not in snapshot or name not in candidates:
+            diffs.append((name, None, "present" if name in snapshot else "missing", "present" if name in candidates else "missing"))
+            continue
+        expected = snapshot[name]
+        try:
+            decoder = Decoder(*candidates[name])
+        except ValueError as e:
+            if expected != str(e):
+                diffs.append((name, None, expected if type(expected) == str else "decoder", str(e)))
+            continue
+        if type(expected) == str:
+            diffs.append((name, None, expected, "decoder"))
+            continue
+        for path, decode in lookup_paths(decoder, list(expected)).items():
+            actual = decode(list(expected))
+            diffs.extend((f"{name} {path}", word, record, actual[word]) for word, record in expected.items() if actual[word] != record)
+    return diffs
+
+
+def dump(file: str, snapshot: dict[str, dict[int, str] | str]):
+    lines = [FORMAT]
+    for name, records in snapshot.items():
+        if type(records) == str:
+            lines.append(f"[{name}]\t{records}")
+            continue
+        lines.append(f"[{name}]")
+        lines.extend(f"{word:08x}\t{record}" for word, record in records.items())
+    with lzma.open(file, "wt") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def load(file: str) -> dict[str, dict[int, str] | str]:
+    with lzma.open(file, "rt") as f:
+        lines = f.read().splitlines()
+    if not lines or lines[0] != FORMAT:
+        raise ValueError("not a decode snapshot")
+
+    snapshot = {}
+    records = None
+    for line in lines[1:]:
+        if line.startswith("["):
+            name, _, error = line[1:].partition("]")
+            if error:
+                snapshot[name] = error[1:]
+            else:
+                records = snapshot[name] = {}
+        else:
+            word, _, record = line.partition("\t")
+            records[int(word, 16)] = record
+    return snapshot
@@ -0,0 +1,141 @@
+from array import array
+from multiprocessing import shared_memory
+from zlib import crc32
+import struct
+
+from .decoder import Decoder, Map, Lv
+from .instruction import Instruction
+
+
+WALK = 0xffff
+
+HEADER = struct.Struct("=4sIIII")
+MAGIC = b"PVDT"
+
+
+def leaf_classes(categories: list, mode: str = "SPEenable") -> list[type[Instruction]]:
+    # walks the Level definitions instead of the merged map, so attaching processes don't build it
+    classes = []
+
+    def collect(level: type[Lv]):
+        for child in level.childs.values():
+            if issubclass(child, Instruction):
+                classes.append(child)
+            else:
+                collect(child)
+
+    for level in Decoder.levels(categories or [], mode.upper()):
+        collect(level)
+    return classes
+
+
+class DecodeTables:
+    # flattened decode tree
+    #   nodes[3 * i : 3 * i + 3] = start, end and children base of node i (node 0 is the root)
+    #   children[base + key]     = leaf id (> 0), -node index (< 0), or 0 when the key has no child
+    #   op16[halfword]           = leaf id when the first 16 bits decide the class, else WALK
+    #   lengths[leaf id]         = instruction length
+
+    def __init__(self, classes: list[type[Instruction]], nodes, children, op16, lengths):
+        self.classes = [None, *classes]
+        self.nodes = nodes
+        self.children = children
+        self.op16 = op16
+        self.lengths = lengths
+        self.shm = None
+
+    @classmethod
+    def compile(cls, decoder: Decoder) -> "DecodeTables":
+        classes = leaf_classes(decoder.categories, decoder.mode)
+        ids = {inst_cls: i + 1 for i, inst_cls in enumerate(classes)}
+        nodes, children = array("i"), array("i")
+
+        pending = [decoder.map]
+        index = {id(decoder.map): 0}
+        while pending:
+            node = pending.pop(0)
+            base = len(children)
+            nodes.extend((node.start, node.end, base))
+            children.extend([0] * (1 << (node.end - node.start)))
+            for key, child in node.childs.items():
+                if isinstance(child, Map):
+                    index[id(child)] = len(index)
+                    pending.append(child)
+                    children[base + key] = -index[id(child)]
+                else:
+                    children[base + key] = ids[child]
+
+        lengths = array("B", [0] + [inst_cls._length for inst_cls in classes])
+        tables = cls(classes, nodes, children, array("H", [WALK]) * 0x10000, lengths)
+        for halfword in range(0x10000):
+            tables.op16[halfword] = tables.walk(halfword << 16, 16)
+        return tables
+
+    def walk(self, data: int, limit: int = 32) -> int:
+        nodes, children = self.nodes, self.children
+        node = 0
+        while True:
+            end = nodes[node + 1]
+            if end > limit:
+                return WALK
+            child = children[nodes[node + 2] + ((data >> (32 - end)) & ((1 << (end - nodes[node])) - 1))]
+            if child >= 0:
+                return child
+            node = -child * 3
+
+    def lookup(self, data: int) -> type[Instruction] | None:
+        leaf = self.op16[data >> 16]
+        if leaf == WALK:
+            leaf = self.walk(data)
+        return self.classes[leaf]
+
+    def checksum(self) -> int:
+        return crc32(" ".join(inst_cls._name for inst_cls in self.classes[1:]).encode())
+
+    def to_bytes(self) -> bytes:
+        header = HEADER.pack(MAGIC, len(self.nodes), len(self.children), len(self.lengths), self.checksum())
+        return header + self.nodes.tobytes() + self.children.tobytes() + self.op16.tobytes() + self.lengths.tobytes()
+
+    @classmethod
+    def from_buffer(cls, buffer, categories: list, mode: str = "SPEenable") -> "DecodeTables":
+        # arrays are memoryview casts into buffer, nothing is copied
+        magic, n_nodes, n_children, n_lengths, checksum = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("not a decode table buffer")
+
+        view = memoryview(buffer)
+        offset = HEADER.size
+        arrays = []
+        for fmt, count in (("i", n_nodes), ("i", n_children), ("H", 0x10000), ("B", n_lengths)):
+            size = struct.calcsize(fmt) * count
+            arrays.append(view[offset:offset + size].cast(fmt))
+            offset += size
+
+        tables = cls(leaf_classes(categories, mode), *arrays)
+        if len(tables.classes) != n_lengths or tables.checksum() != checksum:
+            raise ValueError("decode tables were built for another category set")
+        return tables
+
+    def publish(self, name: str = None) -> shared_memory.SharedMemory:
+        data = self.to_bytes()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        shm.buf[:len(data)] = data
+        return shm
+
+    @classmethod
+    def attach(cls, name: str, categories: list, mode: str = "SPEenable") -> tuple["DecodeTables", shared_memory.SharedMemory]:
+        # keep the returned SharedMemory alive as long as the tables are in use,
+        # e.g. Decoder(categories, mode, tables=tables) in each worker, and release() them on teardown
+        shm = shared_memory.SharedMemory(name=name)
+        tables = cls.from_buffer(shm.buf, categories, mode)
+        tables.shm = shm
+        return tables, shm
+
+    def release(self):
+        # SharedMemory.close() raises BufferError while the array views into it exist
+        for view in (self.nodes, self.children, self.op16, self.lengths):
+            if isinstance(view, memoryview):
+                view.release()
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
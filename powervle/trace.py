@@ -0,0 +1,95 @@
+import struct
+import threading
+from time import perf_counter_ns
+
+from binaryninja.lowlevelil import LowLevelILFunction
+
+
+# compact binary trace of the architecture callbacks binary ninja makes during analysis.
+#   header: MAGIC, version
+#   record: kind, data length, addr, data
+MAGIC = b"PVTR"
+VERSION = 1
+HEADER = struct.Struct(">4sH")
+RECORD = struct.Struct(">BBI")
+
+INFO = 0
+TEXT = 1
+LLIL = 2
+
+TRACED_CALLBACKS = {
+    "get_instruction_info": INFO,
+    "get_instruction_text": TEXT,
+    "get_instruction_low_level_il": LLIL,
+}
+KIND_NAMES = {kind: callback for callback, kind in TRACED_CALLBACKS.items()}
+
+
+class TraceRecorder:
+    # callbacks come from several analysis threads, records are appended under a lock
+    # and written in chunks
+
+    def __init__(self, file: str, max_data: int = 8, chunk: int = 1 << 16):
+        self.file = open(file, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.max_data = max_data
+        self.chunk = chunk
+        self.buffer = bytearray()
+        self.records = 0
+        self.lock = threading.Lock()
+
+    def record(self, kind: int, data: bytes, addr: int):
+        data = bytes(data[:self.max_data])
+        with self.lock:
+            self.buffer += RECORD.pack(kind, len(data), addr & 0xffffffff)
+            self.buffer += data
+            self.records += 1
+            if len(self.buffer) >= self.chunk:
+                self.file.write(self.buffer)
+                self.buffer.clear()
+
+    def close(self):
+        with self.lock:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+            self.file.close()
+
+
+def read_trace(file: str) -> list[tuple[int, int, bytes]]:
+    with open(file, "rb") as f:
+        buffer = f.read()
+
+    magic, version = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("not a power-vle callback trace")
+    if version != VERSION:
+        raise ValueError(f"unsupported trace version {version}")
+
+    records = []
+    offset = HEADER.size
+    while offset + RECORD.size <= len(buffer):
+        kind, length, addr = RECORD.unpack_from(buffer, offset)
+        offset += RECORD.size
+        records.append((kind, addr, buffer[offset:offset + length]))
+        offset += length
+    return records
+
+
+def replay(arch, records: list[tuple[int, int, bytes]], kinds=(INFO, TEXT, LLIL)) -> dict[str, dict]:
+    # pushes the recorded traffic through the architecture callbacks, returns time and count per callback
+    callbacks = {kind: getattr(arch, KIND_NAMES[kind]) for kind in kinds}
+    totals = {KIND_NAMES[kind]: {"count": 0, "total_ns": 0} for kind in kinds}
+    il = LowLevelILFunction(arch)
+    for kind, addr, data in records:
+        if (callback := callbacks.get(kind, None)) is None:
+            continue
+        start = perf_counter_ns()
+        if kind == LLIL:
+            callback(data, addr, il)
+        else:
+            callback(data, addr)
+        total = totals[KIND_NAMES[kind]]
+        total["total_ns"] += perf_counter_ns() - start
+        total["count"] += 1
+    totals["il"] = {"expressions": len(il.exprs), "instructions": len(il.instructions)}
+    return totals
@@ -0,0 +1,40 @@
+import os
+import threading
+
+from binaryninja.log import log_debug
+
+from .lowlevelil import resolve_lifters
+from .tables import DecodeTables
+
+
+def lower_priority():
+    # linux applies PRIO_PROCESS to the calling thread when given its thread id, elsewhere this is skipped
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+def warm_up(arch):
+    # callbacks keep using the decode tree until use_tables swaps the lookup in one assignment.
+    # the tables also replace a loaded profile's fast path, which only adds a layer in front of them.
+    # text tokens depend on each instruction's operand values, so there are no token templates to build
+    decoder = arch.decode.decoder
+    if decoder.tables is None:
+        decoder.use_tables(DecodeTables.compile(decoder))
+    resolve_lifters()
+
+
+def start_warm_up(arch) -> threading.Thread:
+    def run():
+        lower_priority()
+        try:
+            warm_up(arch)
+            log_debug(f"{arch.name}: decode tables and lifters ready")
+        except Exception as e:
+            # a failed warm-up only costs speed, the regular decode path stays in place
+            log_debug(f"{arch.name}: warm-up failed: {e!r}")
+
+    thread = threading.Thread(target=run, name=f"{arch.name}-warm-up", daemon=True)
+    thread.start()
+    return thread
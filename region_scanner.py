@@ -0,0 +1,40 @@
+import stubs
+stubs.install()
+
+from powervle.decoder import Decoder
+from powervle.interface import PowerVLE
+from powervle.scanner import score_windows, region_map
+
+
+if __name__ == "__main__":
+    hexint = lambda x: int(x, 16)
+    from argparse import ArgumentParser
+    parser = ArgumentParser()
+    parser.add_argument("file")
+    parser.add_argument("--base", type=hexint, default=0)
+    parser.add_argument("--window", type=hexint, default=0x100)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--json", help="write the region map as json")
+    parser.add_argument("--windows", action='store_true', help="print every window score")
+    args = parser.parse_args()
+
+    with open(args.file, 'rb') as f:
+        data = f.read()
+
+    decoder = Decoder(PowerVLE.categories)
+    windows = score_windows(decoder, data, args.base, args.window)
+    regions = region_map(windows, args.threshold)
+
+    if args.windows:
+        for w in windows:
+            branches = "-" if w.branches == None else f"{w.branches:.2f}"
+            print(f"{w.start:08x}-{w.end:08x}  score={w.score:.2f} valid={w.valid:.2f} "
+                  f"lifted={w.lifted:.2f} branches={branches} entropy={w.entropy:.2f}")
+
+    for r in regions:
+        print(f"{r['start']:08x}-{r['end']:08x}  {r['kind']:<4}  {r['score']:.2f}")
+
+    if args.json:
+        import json
+        with open(args.json, "w") as f:
+            json.dump(regions, f, indent=2)
@@ -0,0 +1,16 @@
+import importlib.util
+import os
+import sys
+
+
+STUBS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def install(force: bool = False) -> bool:
+    # puts the headless binaryninja stand-in on sys.path when the real api is not importable.
+    # returns whether the stubs are in use
+    if not force and "binaryninja" not in sys.modules and importlib.util.find_spec("binaryninja") is not None:
+        return False
+    if STUBS_DIR not in sys.path:
+        sys.path.insert(0, STUBS_DIR)
+    return True
@@ -0,0 +1,20 @@
+# headless stand-in for the parts of the binary ninja python api this plugin uses.
+# install with stubs.install() when binaryninja is not importable
+
+from .enums import (
+    Endianness, BranchType, FlagRole, InstructionTextTokenType, LowLevelILOperation
+)
+from .architecture import (
+    Architecture, RegisterInfo, InstructionInfo, InstructionTextToken,
+    Intrinsic, IntrinsicInfo, IntrinsicInput
+)
+from .lowlevelil import (
+    LowLevelILFunction, LowLevelILLabel, LowLevelILExpr, ExpressionIndex, ILRegister, ILFlag
+)
+from .callingconvention import CallingConvention
+from .binaryview import BinaryView
+from .function import Function
+from .plugin import PluginCommand
+from .settings import Settings
+from .types import Type
+from .log import log_debug, log_info, log_warn, log_error
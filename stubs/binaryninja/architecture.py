@@ -0,0 +1,133 @@
+from .enums import Endianness, BranchType, InstructionTextTokenType
+from .callingconvention import CallingConvention
+
+
+FlagType = str
+FlagWriteTypeName = str
+RegisterName = str
+
+
+class RegisterInfo:
+
+    def __init__(self, full_width_reg: str, size: int, offset: int = 0, extend=None, index=None):
+        self.full_width_reg = full_width_reg
+        self.size = size
+        self.offset = offset
+        self.extend = extend
+        self.index = index
+
+
+class InstructionBranch:
+
+    def __init__(self, branch_type: BranchType, target: int = 0, arch=None):
+        self.type = branch_type
+        self.target = target
+        self.arch = arch
+
+
+class InstructionInfo:
+
+    def __init__(self, length: int = 0):
+        self.length = length
+        self.branch_delay = 0
+        self.branches = []
+
+    def add_branch(self, branch_type: BranchType, target: int = 0, arch=None):
+        self.branches.append(InstructionBranch(branch_type, target, arch))
+
+
+class InstructionTextToken:
+
+    def __init__(self, token_type: InstructionTextTokenType, text: str, value: int = 0, size: int = 0, operand: int = 0xffffffff):
+        self.type = token_type
+        self.text = text
+        self.value = value
+        self.size = size
+        self.operand = operand
+
+    def __str__(self):
+        return self.text
+
+
+class IntrinsicInput:
+
+    def __init__(self, type, name: str = ""):
+        self.type = type
+        self.name = name
+
+
+class IntrinsicInfo:
+
+    def __init__(self, inputs: list, outputs: list, index: int = None):
+        self.inputs = inputs
+        self.outputs = outputs
+        self.index = index
+
+
+class Intrinsic:
+
+    def __init__(self, arch, name: str):
+        self.arch = arch
+        self.name = name
+
+
+class Platform:
+
+    def __init__(self, arch):
+        self.arch = arch
+        self.default_calling_convention = None
+
+
+class _ArchitectureMeta(type):
+    # Architecture["name"] and iteration over the registered architectures
+
+    def __getitem__(cls, name: str) -> "Architecture":
+        return Architecture._registered[name]
+
+    def __iter__(cls):
+        return iter(list(Architecture._registered.values()))
+
+    def __contains__(cls, name: str) -> bool:
+        return name in Architecture._registered
+
+
+class Architecture(metaclass=_ArchitectureMeta):
+    name = None
+    endianness = Endianness.LittleEndian
+    address_size = 8
+    default_int_size = 4
+    instr_alignment = 1
+    max_instr_length = 16
+    regs = {}
+    stack_pointer = None
+    link_reg = None
+    flags = []
+    flag_roles = {}
+    flag_write_types = []
+    flags_written_by_flag_write_type = {}
+    intrinsics = {}
+
+    _registered = {}
+
+    def __init__(self):
+        self.calling_conventions = {}
+        self.standalone_platform = Platform(self)
+
+    @classmethod
+    def register(cls):
+        Architecture._registered[cls.name] = cls()
+
+    def register_calling_convention(self, cc: CallingConvention):
+        self.calling_conventions[cc.name] = cc
+
+    def get_instruction_info(self, data: bytes, addr: int) -> InstructionInfo | None:
+        return None
+
+    def get_instruction_text(self, data: bytes, addr: int):
+        return None
+
+    def get_instruction_low_level_il(self, data: bytes, addr: int, il) -> int | None:
+        return None
+
+    def get_flag_write_low_level_il(self, op, size: int, write_type: FlagWriteTypeName, flag: FlagType, operands: list, il):
+        return il.unimplemented()
@@ -0,0 +1,18 @@
+class BinaryView:
+
+    def __init__(self, arch=None, data: bytes = b"", start: int = 0):
+        self.arch = arch
+        self.data = data
+        self.start = start
+
+    def read(self, addr: int, length: int) -> bytes:
+        offset = addr - self.start
+        return self.data[max(offset, 0):max(offset + length, 0)]
+
+
+class BinaryViewType:
+    initial_analysis_completion_events = []
+
+    @classmethod
+    def add_binaryview_initial_analysis_completion_event(cls, callback):
+        cls.initial_analysis_completion_events.append(callback)
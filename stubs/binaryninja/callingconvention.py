@@ -0,0 +1,11 @@
+class CallingConvention:
+    name = None
+    callee_saved_regs = []
+    caller_saved_regs = []
+    int_arg_regs = []
+    int_return_reg = None
+
+    def __init__(self, arch=None, name: str = None):
+        self.arch = arch
+        if name is not None:
+            self.name = name
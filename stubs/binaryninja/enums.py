@@ -0,0 +1,62 @@
+from enum import IntEnum
+
+
+class Endianness(IntEnum):
+    LittleEndian = 0
+    BigEndian = 1
+
+
+class BranchType(IntEnum):
+    UnconditionalBranch = 0
+    FalseBranch = 1
+    TrueBranch = 2
+    CallDestination = 3
+    FunctionReturn = 4
+    SystemCall = 5
+    IndirectBranch = 6
+    ExceptionBranch = 7
+    UnresolvedBranch = 127
+    UserDefinedBranch = 128
+
+
+class FlagRole(IntEnum):
+    SpecialFlagRole = 0
+    ZeroFlagRole = 1
+    PositiveSignFlagRole = 2
+    NegativeSignFlagRole = 3
+    SignFlagRole = 4
+    CarryFlagRole = 5
+    OverflowFlagRole = 6
+    HalfCarryFlagRole = 7
+    EvenParityFlagRole = 8
+    OddParityFlagRole = 9
+    OrderedFlagRole = 10
+    UnorderedFlagRole = 11
+
+
+class InstructionTextTokenType(IntEnum):
+    TextToken = 0
+    InstructionToken = 1
+    OperandSeparatorToken = 2
+    RegisterToken = 3
+    IntegerToken = 4
+    PossibleAddressToken = 5
+    BeginMemoryOperandToken = 6
+    EndMemoryOperandToken = 7
+    FloatingPointToken = 8
+    AnnotationToken = 9
+    CodeRelativeAddressToken = 10
+
+
+LowLevelILOperation = IntEnum("LowLevelILOperation", [
+    "LLIL_NOP", "LLIL_SET_REG", "LLIL_SET_FLAG", "LLIL_LOAD", "LLIL_STORE", "LLIL_REG", "LLIL_FLAG",
+    "LLIL_CONST", "LLIL_CONST_PTR", "LLIL_ADD", "LLIL_ADC", "LLIL_SUB", "LLIL_SBB", "LLIL_AND", "LLIL_OR",
+    "LLIL_XOR", "LLIL_LSL", "LLIL_LSR", "LLIL_ASR", "LLIL_ROL", "LLIL_ROR", "LLIL_MUL", "LLIL_MULU_DP",
+    "LLIL_MULS_DP", "LLIL_DIVU", "LLIL_DIVS", "LLIL_NEG", "LLIL_NOT", "LLIL_SX", "LLIL_ZX", "LLIL_LOW_PART",
+    "LLIL_JUMP", "LLIL_CALL", "LLIL_RET", "LLIL_IF", "LLIL_GOTO", "LLIL_CMP_E", "LLIL_CMP_NE",
+    "LLIL_CMP_SLT", "LLIL_CMP_ULT", "LLIL_CMP_SLE", "LLIL_CMP_ULE", "LLIL_CMP_SGE", "LLIL_CMP_UGE",
+    "LLIL_CMP_SGT", "LLIL_CMP_UGT", "LLIL_TEST_BIT", "LLIL_SYSCALL", "LLIL_INTRINSIC", "LLIL_UNDEF",
+    "LLIL_UNIMPL", "LLIL_FADD", "LLIL_FSUB", "LLIL_FMUL", "LLIL_FDIV", "LLIL_FNEG", "LLIL_FABS",
+    "LLIL_FLOAT_TO_INT", "LLIL_INT_TO_FLOAT", "LLIL_FLOAT_CONV", "LLIL_FCMP_E", "LLIL_FCMP_LT",
+    "LLIL_FCMP_GT",
+], start=0)
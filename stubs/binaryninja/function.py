@@ -0,0 +1,3 @@
+class Function:
+    # only a type here, headless tools never get one
+    pass
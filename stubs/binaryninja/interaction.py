@@ -0,0 +1,3 @@
+def get_save_filename_input(prompt: str, ext: str = "", default_name: str = ""):
+    # headless, nothing to ask
+    return None
@@ -0,0 +1,22 @@
+import logging
+
+
+# silent unless the caller configures logging
+logger = logging.getLogger("binaryninja")
+logger.addHandler(logging.NullHandler())
+
+
+def log_debug(msg, logger_name: str = None):
+    logger.debug(msg)
+
+
+def log_info(msg, logger_name: str = None):
+    logger.info(msg)
+
+
+def log_warn(msg, logger_name: str = None):
+    logger.warning(msg)
+
+
+def log_error(msg, logger_name: str = None):
+    logger.error(msg)
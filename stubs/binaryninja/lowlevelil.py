@@ -0,0 +1,213 @@
+from .enums import LowLevelILOperation
+
+
+class ExpressionIndex(int):
+    # an int like the real api's, but distinguishable from constant operands when rendering
+    pass
+
+
+class ILRegister:
+
+    def __init__(self, arch, name: str):
+        self.arch = arch
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+class ILFlag(ILRegister):
+    pass
+
+
+ILRegisterType = ILRegister | ILFlag | int
+
+
+def LLIL_TEMP(n: int) -> int:
+    return n | 0x80000000
+
+
+class LowLevelILLabel:
+
+    def __init__(self):
+        self.operand = None
+
+
+class LowLevelILExpr:
+    __slots__ = ("operation", "size", "operands", "flags")
+
+    def __init__(self, operation: LowLevelILOperation, size: int, operands: tuple, flags):
+        self.operation = operation
+        self.size = size
+        self.operands = operands
+        self.flags = flags
+
+
+def _unary(operation: LowLevelILOperation):
+    def builder(self, size: int, value, flags=None) -> ExpressionIndex:
+        return self.expr(operation, value, size=size, flags=flags)
+    return builder
+
+
+def _binary(operation: LowLevelILOperation):
+    def builder(self, size: int, a, b, flags=None) -> ExpressionIndex:
+        return self.expr(operation, a, b, size=size, flags=flags)
+    return builder
+
+
+def _carry(operation: LowLevelILOperation):
+    def builder(self, size: int, a, b, carry, flags=None) -> ExpressionIndex:
+        return self.expr(operation, a, b, carry, size=size, flags=flags)
+    return builder
+
+
+def _nullary(operation: LowLevelILOperation):
+    def builder(self) -> ExpressionIndex:
+        return self.expr(operation)
+    return builder
+
+
+class LowLevelILFunction:
+    # records every expression as a tree node instead of handing it to the core
+
+    def __init__(self, arch=None):
+        self.arch = arch
+        self.exprs = []
+        self.instructions = []
+
+    def expr(self, operation: LowLevelILOperation, *operands, size: int = 0, flags=None) -> ExpressionIndex:
+        self.exprs.append(LowLevelILExpr(operation, size, operands, flags))
+        return ExpressionIndex(len(self.exprs) - 1)
+
+    def append(self, expr: ExpressionIndex) -> int:
+        self.instructions.append(expr)
+        return len(self.instructions) - 1
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def __getitem__(self, index: int) -> LowLevelILExpr:
+        return self.exprs[self.instructions[index]]
+
+    def const(self, size: int, value: int) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_CONST, value, size=size)
+
+    def const_pointer(self, size: int, value: int) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_CONST_PTR, value, size=size)
+
+    def reg(self, size: int, reg) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_REG, reg, size=size)
+
+    def set_reg(self, size: int, reg, value, flags=None) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_SET_REG, reg, value, size=size, flags=flags)
+
+    def flag(self, reg) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_FLAG, reg)
+
+    def load(self, size: int, addr) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_LOAD, addr, size=size)
+
+    def store(self, size: int, addr, value, flags=None) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_STORE, addr, value, size=size, flags=flags)
+
+    def jump(self, dest) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_JUMP, dest)
+
+    def call(self, dest) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_CALL, dest)
+
+    def ret(self, dest) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_RET, dest)
+
+    def goto(self, label: LowLevelILLabel) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_GOTO, label)
+
+    def if_expr(self, operand, t: LowLevelILLabel, f: LowLevelILLabel) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_IF, operand, t, f)
+
+    def intrinsic(self, outputs: list, intrinsic: str, params: list, flags=None) -> ExpressionIndex:
+        return self.expr(LowLevelILOperation.LLIL_INTRINSIC, tuple(outputs), intrinsic, tuple(params), flags=flags)
+
+    def mark_label(self, label: LowLevelILLabel):
+        label.operand = len(self.instructions)
+
+    def get_label_for_address(self, arch, addr: int) -> LowLevelILLabel | None:
+        return None
+
+    add = _binary(LowLevelILOperation.LLIL_ADD)
+    sub = _binary(LowLevelILOperation.LLIL_SUB)
+    and_expr = _binary(LowLevelILOperation.LLIL_AND)
+    or_expr = _binary(LowLevelILOperation.LLIL_OR)
+    xor_expr = _binary(LowLevelILOperation.LLIL_XOR)
+    shift_left = _binary(LowLevelILOperation.LLIL_LSL)
+    logical_shift_right = _binary(LowLevelILOperation.LLIL_LSR)
+    arith_shift_right = _binary(LowLevelILOperation.LLIL_ASR)
+    rotate_left = _binary(LowLevelILOperation.LLIL_ROL)
+    rotate_right = _binary(LowLevelILOperation.LLIL_ROR)
+    mult = _binary(LowLevelILOperation.LLIL_MUL)
+    mult_double_prec_unsigned = _binary(LowLevelILOperation.LLIL_MULU_DP)
+    mult_double_prec_signed = _binary(LowLevelILOperation.LLIL_MULS_DP)
+    div_unsigned = _binary(LowLevelILOperation.LLIL_DIVU)
+    div_signed = _binary(LowLevelILOperation.LLIL_DIVS)
+    compare_equal = _binary(LowLevelILOperation.LLIL_CMP_E)
+    compare_not_equal = _binary(LowLevelILOperation.LLIL_CMP_NE)
+    compare_signed_less_than = _binary(LowLevelILOperation.LLIL_CMP_SLT)
+    compare_unsigned_less_than = _binary(LowLevelILOperation.LLIL_CMP_ULT)
+    compare_signed_less_equal = _binary(LowLevelILOperation.LLIL_CMP_SLE)
+    compare_unsigned_less_equal = _binary(LowLevelILOperation.LLIL_CMP_ULE)
+    compare_signed_greater_equal = _binary(LowLevelILOperation.LLIL_CMP_SGE)
+    compare_unsigned_greater_equal = _binary(LowLevelILOperation.LLIL_CMP_UGE)
+    compare_signed_greater_than = _binary(LowLevelILOperation.LLIL_CMP_SGT)
+    compare_unsigned_greater_than = _binary(LowLevelILOperation.LLIL_CMP_UGT)
+    test_bit = _binary(LowLevelILOperation.LLIL_TEST_BIT)
+    float_add = _binary(LowLevelILOperation.LLIL_FADD)
+    float_sub = _binary(LowLevelILOperation.LLIL_FSUB)
+    float_mult = _binary(LowLevelILOperation.LLIL_FMUL)
+    float_div = _binary(LowLevelILOperation.LLIL_FDIV)
+    float_compare_equal = _binary(LowLevelILOperation.LLIL_FCMP_E)
+    float_compare_less_than = _binary(LowLevelILOperation.LLIL_FCMP_LT)
+    float_compare_greater_than = _binary(LowLevelILOperation.LLIL_FCMP_GT)
+
+    add_carry = _carry(LowLevelILOperation.LLIL_ADC)
+    sub_borrow = _carry(LowLevelILOperation.LLIL_SBB)
+
+    neg_expr = _unary(LowLevelILOperation.LLIL_NEG)
+    not_expr = _unary(LowLevelILOperation.LLIL_NOT)
+    sign_extend = _unary(LowLevelILOperation.LLIL_SX)
+    zero_extend = _unary(LowLevelILOperation.LLIL_ZX)
+    low_part = _unary(LowLevelILOperation.LLIL_LOW_PART)
+    float_neg = _unary(LowLevelILOperation.LLIL_FNEG)
+    float_abs = _unary(LowLevelILOperation.LLIL_FABS)
+    float_to_int = _unary(LowLevelILOperation.LLIL_FLOAT_TO_INT)
+    int_to_float = _unary(LowLevelILOperation.LLIL_INT_TO_FLOAT)
+    float_convert = _unary(LowLevelILOperation.LLIL_FLOAT_CONV)
+
+    nop = _nullary(LowLevelILOperation.LLIL_NOP)
+    system_call = _nullary(LowLevelILOperation.LLIL_SYSCALL)
+    undefined = _nullary(LowLevelILOperation.LLIL_UNDEF)
+    unimplemented = _nullary(LowLevelILOperation.LLIL_UNIMPL)
+
+    @staticmethod
+    def render_reg(reg) -> str:
+        return f"temp{reg & 0x7fffffff}" if isinstance(reg, int) and reg & 0x80000000 else str(reg)
+
+    def render(self, index: int) -> str:
+        # e.g. LLIL_SET_REG.4(r3, LLIL_ADD.4(LLIL_REG.4(r4), LLIL_CONST.4(0x10)))
+        expr = self.exprs[index]
+        operands = []
+        for operand in expr.operands:
+            if isinstance(operand, ExpressionIndex):
+                operands.append(self.render(operand))
+            elif isinstance(operand, tuple):
+                operands.append("[" + ", ".join(self.render(o) if isinstance(o, ExpressionIndex) else self.render_reg(o) for o in operand) + "]")
+            elif isinstance(operand, LowLevelILLabel):
+                operands.append(f"label@{operand.operand}")
+            elif isinstance(operand, int) and expr.operation in (LowLevelILOperation.LLIL_REG, LowLevelILOperation.LLIL_SET_REG):
+                operands.append(self.render_reg(operand))
+            elif isinstance(operand, int):
+                operands.append(hex(operand))
+            else:
+                operands.append(str(operand))
+        size = f".{expr.size}" if expr.size else ""
+        flags = f"{{{expr.flags}}}" if expr.flags else ""
+        return f"{expr.operation.name}{size}{flags}({', '.join(operands)})"
@@ -0,0 +1,10 @@
+class PluginCommand:
+    commands = []
+
+    @classmethod
+    def register(cls, name: str, description: str, action, is_valid=None):
+        cls.commands.append((name, description, action, is_valid))
+
+    @classmethod
+    def register_for_function(cls, name: str, description: str, action, is_valid=None):
+        cls.commands.append((name, description, action, is_valid))
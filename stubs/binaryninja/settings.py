@@ -0,0 +1,59 @@
+import json
+
+
+class Settings:
+    # one process-wide store: registered schemas and values set at default scope
+    _groups = {}
+    _schemas = {}
+    _values = {}
+
+    def __init__(self, instance_id: str = "default"):
+        self.instance_id = instance_id
+
+    def register_group(self, group: str, title: str) -> bool:
+        self._groups[group] = title
+        return True
+
+    def register_setting(self, key: str, properties: str) -> bool:
+        if key.split(".")[0] not in self._groups:
+            return False
+        self._schemas[key] = json.loads(properties)
+        return True
+
+    def contains(self, key: str) -> bool:
+        return key in self._schemas
+
+    def keys(self) -> list[str]:
+        return list(self._schemas)
+
+    def _get(self, key: str, kind: type):
+        if key not in self._schemas:
+            return kind()
+        return kind(self._values.get(key, self._schemas[key].get("default", kind())))
+
+    def get_bool(self, key: str, view=None) -> bool:
+        return self._get(key, bool)
+
+    def get_integer(self, key: str, view=None) -> int:
+        return self._get(key, int)
+
+    def get_string(self, key: str, view=None) -> str:
+        return self._get(key, str)
+
+    def _set(self, key: str, value) -> bool:
+        if key not in self._schemas:
+            return False
+        self._values[key] = value
+        return True
+
+    def set_bool(self, key: str, value: bool, view=None, scope=None) -> bool:
+        return self._set(key, value)
+
+    def set_integer(self, key: str, value: int, view=None, scope=None) -> bool:
+        return self._set(key, value)
+
+    def set_string(self, key: str, value: str, view=None, scope=None) -> bool:
+        return self._set(key, value)
+
+    def reset(self, key: str, view=None, scope=None) -> bool:
+        return self._values.pop(key, None) is not None
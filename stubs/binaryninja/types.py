@@ -0,0 +1,17 @@
+class Type:
+
+    def __init__(self, kind: str, width: int, signed: bool = False):
+        self.kind = kind
+        self.width = width
+        self.signed = signed
+
+    @staticmethod
+    def int(width: int, sign: bool = True) -> "Type":
+        return Type("int", width, sign)
+
+    @staticmethod
+    def float(width: int) -> "Type":
+        return Type("float", width)
+
+    def __repr__(self):
+        return f"<type: {self.kind}{self.width * 8}>"
@@ -0,0 +1,38 @@
+import stubs
+stubs.install()
+
+from powervle.interface import PowerVLE, PowerVLEVariants, variant_arch
+from powervle.trace import read_trace, replay, KIND_NAMES
+
+
+if __name__ == "__main__":
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description="replay a recorded callback trace through the decoder, text renderer and lifters")
+    parser.add_argument("trace")
+    parser.add_argument("--variant", default=PowerVLE.name, choices=list(PowerVLEVariants))
+    parser.add_argument("--kinds", default="info,text,llil", help="comma separated subset of info, text, llil")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--json", help="write the timings as json")
+    args = parser.parse_args()
+
+    records = read_trace(args.trace)
+    kinds = [{"info": 0, "text": 1, "llil": 2}[k] for k in args.kinds.split(",")]
+
+    arch = variant_arch(args.variant)
+
+    results = []
+    for i in range(args.repeat):
+        # the first round fills the decode cache like the original analysis did
+        totals = replay(arch, records, kinds)
+        results.append(totals)
+        for callback in (KIND_NAMES[kind] for kind in kinds):
+            total = totals[callback]
+            mean = total["total_ns"] / total["count"] if total["count"] else 0
+            print(f"round {i}  {callback:<30} {total['count']:>9}  {total['total_ns'] / 1e6:>10.2f} ms  {mean:>8.0f} ns/call")
+
+    print(f"{len(records)} records, cache {arch.decode.stats}")
+
+    if args.json:
+        import json
+        with open(args.json, "w") as f:
+            json.dump({"trace": args.trace, "variant": args.variant, "records": len(records), "rounds": results}, f, indent=2)
@@ -0,0 +1,29 @@
+import stubs
+stubs.install()
+
+from powervle.interface import PowerVLEVariants
+from powervle.scanner import detect_variant
+
+
+if __name__ == "__main__":
+    hexint = lambda x: int(x, 16)
+    from argparse import ArgumentParser
+    parser = ArgumentParser()
+    parser.add_argument("file")
+    parser.add_argument("--base", type=hexint, default=0)
+    parser.add_argument("--window", type=hexint, default=0x100)
+    parser.add_argument("--samples", type=int, default=64)
+    args = parser.parse_args()
+
+    with open(args.file, 'rb') as f:
+        data = f.read()
+
+    ranking = detect_variant(PowerVLEVariants, data, args.base, args.window, args.samples)
+
+    for entry in ranking:
+        if "error" in entry:
+            print(f"{entry['name']:<20} unavailable: {entry['error']}")
+        else:
+            print(f"{entry['name']:<20} score={entry['score']:.3f} valid={entry['valid']:.3f} "
+                  f"lifted={entry['lifted']:.3f} branches={entry['branches']:.3f} windows={entry['windows']}")
+    print(f"recommended: {ranking[0]['name']}")